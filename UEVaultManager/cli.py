@@ -5,17 +5,17 @@ Implementation for:
 """
 import argparse
 import csv
+import io
 import json
 import logging
 import os
 import shutil
-import subprocess
 import sys
 import time
-import webbrowser
-from collections import namedtuple
+import weakref
+from collections import defaultdict, namedtuple
 from logging.handlers import QueueListener
-from multiprocessing import freeze_support, Queue as MPQueue
+from multiprocessing import Queue as MPQueue
 from platform import platform
 from shutil import rmtree
 from tkinter import filedialog
@@ -28,19 +28,16 @@ from UEVaultManager.api.uevm import UpdateSeverity
 from UEVaultManager.core import AppCore
 from UEVaultManager.lfs.utils import copy_folder, path_join
 from UEVaultManager.models.exceptions import InvalidCredentialsError
-from UEVaultManager.models.UEAssetScraperClass import UEAssetScraper
-from UEVaultManager.tkgui.main import init_gui
-from UEVaultManager.tkgui.modules.cls.ChoiceFromListWindowClass import ChoiceFromListWindow
 from UEVaultManager.tkgui.modules.cls.DisplayContentWindowClass import DisplayContentWindow
 from UEVaultManager.tkgui.modules.cls.FakeUEVMGuiClass import FakeUEVMGuiClass
 from UEVaultManager.tkgui.modules.cls.SaferDictClass import SaferDict
-from UEVaultManager.tkgui.modules.cls.UEVMGuiClass import UEVMGui
 from UEVaultManager.tkgui.modules.functions import box_message, box_yesno, create_file_backup, custom_print, exit_and_clean_windows, \
     show_progress  # simplier way to use the custom_print function
 from UEVaultManager.tkgui.modules.functions import json_print_key_val
 from UEVaultManager.tkgui.modules.types import DataSourceType
 from UEVaultManager.utils.cli import check_and_create_file, get_boolean_choice, get_max_threads, remove_command_argument, str_to_bool
 from UEVaultManager.utils.HiddenAliasSubparsersActionClass import HiddenAliasSubparsersAction
+from UEVaultManager.utils.json_fast import json_dumps
 
 # add the parent folder to the sys.path list, to run the script from the command line without import module error
 # must be done before importing project module (ex: global.py)
@@ -49,26 +46,44 @@ from UEVaultManager.utils.HiddenAliasSubparsersActionClass import HiddenAliasSub
 # if path not in sys.path:
 #     sys.path.insert(0, path)
 
-logging.basicConfig(format='[%(name)s] %(levelname)s: %(message)s', level=logging.INFO)
+log_format = '[%(name)s] %(levelname)s: %(message)s'
+logging.basicConfig(format=log_format, level=logging.INFO)
+# handler used by the QueueListener of the threaded logging. Created once and shared by all the listeners
+threaded_log_handler = logging.StreamHandler()
+threaded_log_handler.setFormatter(logging.Formatter(log_format))
+# commands that should not be shown in full help/list of commands (e.g. aliases)
+hidden_help_commands = frozenset({'download', 'update', 'repair', 'get-token', 'verify-asset', 'list-assets'})
 
 
 def init_gui_args(args, additional_args=None) -> None:
     """
     Initialize the GUI arguments using the CLI arguments.
-    :param args: args of the command line.
+    :param args: args of the command line. It's not modified.
     :param additional_args: dict of additional arguments to add.
     """
     # args can not be used as it because it's an object that mainly run as a dict (but it's not)
-    # so we need to convert it to a dict first
-    temp_dict = vars(args)
-    temp_dict['csv'] = True  # force csv output
-    temp_dict['gui'] = True
+    # so we create a SaferDict object from its content (it will avoid errors when trying to access non-existing keys)
+    # Note: vars() returns the namespace own dict, so it must not be modified directly
+    gui_args = SaferDict(vars(args))
+    gui_args['csv'] = True  # force csv output
+    gui_args['gui'] = True
     if additional_args is not None:
-        temp_dict.update(additional_args)
-    # create a SaferDict object from the dict (it will avoid errors when trying to access non-existing keys)
-    gui_g.UEVM_cli_args = SaferDict({})
-    # copy the dict content to the SaferDict object
-    gui_g.UEVM_cli_args.copy_from(temp_dict)
+        gui_args.update(additional_args)
+    gui_g.UEVM_cli_args = gui_args
+
+
+def init_hidden_root() -> bool:
+    """
+    Create a hidden root window if the GUI is not already running.
+    Should only be called when a window must be displayed, because creating a tk root is slow.
+    :return: True if the UEVMGui window already existed | False.
+    """
+    # check if the GUI is already running
+    if gui_g.WindowsRef.uevm_gui is not None:
+        return True
+    # create a fake root because the windows displayed by the CLI must always be top level windows
+    gui_g.WindowsRef.uevm_gui = FakeUEVMGuiClass()
+    return False
 
 
 def init_display_window(logger=None, _message: str = 'Starting command...') -> (bool, DisplayContentWindow):
@@ -79,14 +94,7 @@ def init_display_window(logger=None, _message: str = 'Starting command...') -> (
     :return: (True if the UEVMGui window already existed | False, DisplayContentWindow).
     """
     gui_g.UEVM_log_ref = logger
-
-    # check if the GUI is already running
-    if gui_g.WindowsRef.uevm_gui is None:
-        # create a fake root because DisplayContentWindow must always be a top level window
-        gui_g.WindowsRef.uevm_gui = FakeUEVMGuiClass()
-        uewm_gui_exists = False
-    else:
-        uewm_gui_exists = True
+    uewm_gui_exists = init_hidden_root()
     if gui_g.WindowsRef.display_content is not None:
         gui_g.WindowsRef.display_content.close_window()
 
@@ -105,6 +113,7 @@ class UEVaultManagerCLI:
     """
     is_gui = False  # class property to be accessible by static methods
     release_id = None  # the release id selected for an asset installation
+    _full_help_text = ''  # full help text, built on the first use by get_full_help()
 
     def __init__(self, override_config=None, api_timeout=(7, 7)):  # timeout could be a float or a tuple  (connect timeout, read timeout) in s
         self.core = AppCore(override_config, timeout=api_timeout)
@@ -113,10 +122,8 @@ class UEVaultManagerCLI:
 
     @staticmethod
     def _print_json(data, pretty=False):
-        if pretty:
-            print(json.dumps(data, indent=2, sort_keys=True))
-        else:
-            print(json.dumps(data))
+        # the content is encoded by orjson if installed, and printed with a single write
+        print(json_dumps(data, indent=pretty, sort_keys=pretty))
 
     def _log(self, message, level: str = 'info'):
         level_lower = level.lower()
@@ -213,11 +220,9 @@ class UEVaultManagerCLI:
         """
         Setup logging for the CLI.
         """
+        # Note: a multiprocessing queue is needed here, because it's also used by the download manager processes
         self.logging_queue = MPQueue(-1)
-        handler = logging.StreamHandler()
-        formatter = logging.Formatter('[%(name)s] %(levelname)s: %(message)s')
-        handler.setFormatter(formatter)
-        ql = QueueListener(self.logging_queue, handler)
+        ql = QueueListener(self.logging_queue, threaded_log_handler)
         ql.start()
         return ql
 
@@ -290,6 +295,7 @@ class UEVaultManagerCLI:
                 # unfortunately the captcha stuff makes a complete CLI login flow kinda impossible right now...
                 custom_print('Please log in via the epic web login!')
                 url = 'https://legendary.gl/epiclogin'
+                import webbrowser  # only imported when needed
                 webbrowser.open(url)
                 custom_print(f'If the web page did not open automatically, please manually open the following URL: {url}')
                 auth_code = input('Please enter the "authorizationCode" value from the JSON response: ')
@@ -419,12 +425,16 @@ class UEVaultManagerCLI:
         files = sorted(manifest.file_manifest_list.elements, key=lambda a: a.filename.lower())
         content = ''
         if args.hashlist:
-            for fm in files:
-                content += f'{fm.hash.hex()} *{fm.filename}\n'
+            content = ''.join(f'{fm.hash.hex()} *{fm.filename}\n' for fm in files)
         elif args.csv or args.tsv:
-            writer = csv.writer(sys.stdout, dialect='excel-tab' if args.tsv else 'excel', lineterminator='\n')
+            # build the rows in memory and write them in one go instead of a write() per row on stdout
+            buffer = io.StringIO()
+            writer = csv.writer(buffer, dialect='excel-tab' if args.tsv else 'excel', lineterminator='\n')
             writer.writerow(['path', 'hash', 'size', 'install_tags'])
-            writer.writerows((fm.filename, fm.hash.hex(), fm.file_size, '|'.join(fm.install_tags)) for fm in files)
+            # most files have no install tag, so the join is only done when needed
+            writer.writerows((fm.filename, fm.hash.hex(), fm.file_size, '|'.join(fm.install_tags) if fm.install_tags else '') for fm in files)
+            sys.stdout.write(buffer.getvalue())
+            sys.stdout.flush()
         elif args.json:
             _files = [
                 dict(filename=fm.filename, sha_hash=fm.hash.hex(), install_tags=fm.install_tags, file_size=fm.file_size, flags=fm.flags)
@@ -435,9 +445,8 @@ class UEVaultManagerCLI:
         else:
             install_tags = set()
             for fm in files:
-                content += fm.filename + '\n'
-                for t in fm.install_tags:
-                    install_tags.add(t)
+                install_tags.update(fm.install_tags)
+            content = ''.join(fm.filename + '\n' for fm in files)
             if install_tags:
                 # use the log output so this isn't included when piping file list into file
                 self._log(f'Install tags: {", ".join(sorted(install_tags))}')
@@ -590,7 +599,8 @@ class UEVaultManagerCLI:
             asset_infos = info_items['assets']
             asset_infos.append(InfoItem('Asset name', 'app_name', item.app_name, item.app_name))
             asset_infos.append(InfoItem('Title', 'title', item.app_title, item.app_title))
-            asset_infos.append(InfoItem('Latest version', 'version', item.app_version('Windows'), item.app_version('Windows')))
+            latest_version = item.app_version('Windows')
+            asset_infos.append(InfoItem('Latest version', 'version', latest_version, latest_version))
             all_versions = {k: v.build_version for k, v in item.asset_infos.items()}
             asset_infos.append(InfoItem('All versions', 'platform_versions', all_versions, all_versions))
 
@@ -600,6 +610,11 @@ class UEVaultManagerCLI:
             manifest_size = len(manifest_data)
             manifest_size_human = f'{manifest_size / 1024:.01f} KiB'
             manifest_info.append(InfoItem('Manifest size', 'size', manifest_size_human, manifest_size))
+            # get the total file size and the install tags in a single pass over the files
+            total_file_size = 0
+            for fm in manifest.file_manifest_list.elements:
+                total_file_size += fm.file_size
+                install_tags.update(fm.install_tags)
             manifest_type = 'JSON' if hasattr(manifest, 'json_data') else 'Binary'
             manifest_info.append(InfoItem('Manifest type', 'type', manifest_type, manifest_type.lower()))
             manifest_info.append(InfoItem('Manifest version', 'version', manifest.version, manifest.version))
@@ -645,10 +660,6 @@ class UEVaultManagerCLI:
                 else:
                     manifest_info.append(InfoItem('Uninstaller', 'uninstaller', None, None))
 
-                for fm in manifest.file_manifest_list.elements:
-                    for tag in fm.install_tags:
-                        install_tags.add(tag)
-
                 install_tags = sorted(install_tags)
                 install_tags_human = ', '.join(i if i else '(empty)' for i in install_tags)
                 manifest_info.append(InfoItem('Install tags', 'install_tags', install_tags_human, install_tags))
@@ -656,10 +667,9 @@ class UEVaultManagerCLI:
             manifest_info.append(InfoItem('Files', 'num_files', manifest.file_manifest_list.count, manifest.file_manifest_list.count))
             manifest_info.append(InfoItem('Chunks', 'num_chunks', manifest.chunk_data_list.count, manifest.chunk_data_list.count))
             # total file size
-            total_size = sum(fm.file_size for fm in manifest.file_manifest_list.elements)
-            self.core.uevmlfs.set_asset_size(item.app_name, total_size)  # update the global list AND save it into a json file
-            file_size = gui_fn.format_size(total_size)
-            manifest_info.append(InfoItem('Disk size (uncompressed)', 'disk_size', file_size, total_size))
+            self.core.uevmlfs.set_asset_size(item.app_name, total_file_size)  # update the global list AND save it into a json file
+            file_size = gui_fn.format_size(total_file_size)
+            manifest_info.append(InfoItem('Disk size (uncompressed)', 'disk_size', file_size, total_file_size))
             # total chunk size
             total_size = sum(c.file_size for c in manifest.chunk_data_list.elements)
             chunk_size = gui_fn.format_size(total_size)
@@ -673,29 +683,34 @@ class UEVaultManagerCLI:
                 tag_download_size_human = []
                 if len(install_tags) > 1:
                     longest_tag = max(max(len(t) for t in install_tags), len('(empty)'))
+                    # group the files and the chunk guids by tag in a single pass, instead of scanning all the files for each tag
+                    files_by_tag = defaultdict(list)
+                    chunk_guids_by_tag = defaultdict(set)
+                    for fm in manifest.file_manifest_list.elements:
+                        file_chunk_guids = [cp.guid_num for cp in fm.chunk_parts]
+                        # a file without tag is counted in the empty tag
+                        for tag in fm.install_tags or ('', ):
+                            files_by_tag[tag].append(fm)
+                            chunk_guids_by_tag[tag].update(file_chunk_guids)
+                    chunk_size_by_guid = {c.guid_num: c.file_size for c in manifest.chunk_data_list.elements}
                     for tag in install_tags:
+                        # the tag is padded only once, it's used in both size lines
+                        human_tag = (tag or '(empty)').ljust(longest_tag)
                         # sum up all file sizes for the tag
-                        human_tag = tag or '(empty)'
-                        tag_files = [
-                            fm for fm in manifest.file_manifest_list.elements if (tag in fm.install_tags) or (not tag and not fm.install_tags)
-                        ]
+                        tag_files = files_by_tag.get(tag, [])
                         tag_file_size = sum(fm.file_size for fm in tag_files)
                         tag_disk_size.append(dict(tag=tag, size=tag_file_size, count=len(tag_files)))
                         tag_file_size_human = gui_fn.format_size(tag_file_size)
-                        tag_disk_size_human.append(f'{human_tag.ljust(longest_tag)} - {tag_file_size_human} '
+                        tag_disk_size_human.append(f'{human_tag} - {tag_file_size_human} '
                                                    f'(Files: {len(tag_files)})')
                         # tag_disk_size_human.append(f'Size: {tag_file_size_human}, Files: {len(tag_files)}, Tag: "{tag}"')
-                        # accumulate chunk guids used for this tag and count their size too
-                        tag_chunk_guids = set()
-                        for fm in tag_files:
-                            for cp in fm.chunk_parts:
-                                tag_chunk_guids.add(cp.guid_num)
-
-                        tag_chunk_size = sum(c.file_size for c in manifest.chunk_data_list.elements if c.guid_num in tag_chunk_guids)
+                        # count the size of the chunks used for this tag too
+                        tag_chunk_guids = chunk_guids_by_tag.get(tag, set())
+                        tag_chunk_size = sum(chunk_size_by_guid.get(guid_num, 0) for guid_num in tag_chunk_guids)
                         tag_download_size.append(dict(tag=tag, size=tag_chunk_size, count=len(tag_chunk_guids)))
                         tag_chunk_size_human = gui_fn.format_size(tag_chunk_size)
                         tag_download_size_human.append(
-                            f'{human_tag.ljust(longest_tag)} - {tag_chunk_size_human} '
+                            f'{human_tag} - {tag_chunk_size_human} '
                             f'(Chunks: {len(tag_chunk_guids)})'
                         )
 
@@ -826,11 +841,7 @@ class UEVaultManagerCLI:
         else:
             token = self.core.egs.get_item_token()
         if args.json:
-            if args.pretty_json:
-                print(json.dumps(token, indent=2, sort_keys=True))
-            else:
-                print(json.dumps(token))
-            return
+            return self._print_json(token, args.pretty_json)
         self._log(f'Exchange code: {token["code"]}')
 
     def edit(self, args) -> None:
@@ -855,6 +866,9 @@ class UEVaultManagerCLI:
                 args.no_webview = True
                 self.auth(args)
 
+        # only import here since UEVMGui import is slow (it loads pandas and the whole datatable stack)
+        from UEVaultManager.tkgui.modules.cls.UEVMGuiClass import UEVMGui
+
         rebuild = False
         if not os.path.isfile(data_source):
             is_valid, data_source = gui_fn.create_empty_file(data_source)
@@ -894,13 +908,7 @@ class UEVaultManagerCLI:
         gui_g.progress_window_ref = None
         pw = None
         if UEVaultManagerCLI.is_gui:
-            # check if the GUI is already running
-            if gui_g.WindowsRef.uevm_gui is None:
-                # create a fake root because ProgressWindow must always be a top level window
-                gui_g.WindowsRef.uevm_gui = FakeUEVMGuiClass()
-                uewm_gui_exists = False
-            else:
-                uewm_gui_exists = True
+            uewm_gui_exists = init_hidden_root()
             pw = show_progress(
                 parent=gui_g.WindowsRef.uevm_gui, text='Updating Assets List', quit_on_close=not uewm_gui_exists, force_new_window=True,
             )
@@ -937,6 +945,9 @@ class UEVaultManagerCLI:
             # max_threads = 0  # test only, see exceptions
             # owned_assets_only = True  # True for test only
 
+        # only import here since UEAssetScraper import is slow (it loads the database handler and the scraping stack)
+        from UEVaultManager.models.UEAssetScraperClass import UEAssetScraper
+
         datasource_filename = gui_g.s.sqlite_filename if use_database else file_name
         scraper = UEAssetScraper(
             datasource_filename=datasource_filename,
@@ -1033,6 +1044,8 @@ class UEVaultManagerCLI:
         # by default, we take the lastest release
         release_selected = releases[latest_id]
         if uewm_gui_exists:
+            from UEVaultManager.tkgui.modules.cls.ChoiceFromListWindowClass import ChoiceFromListWindow
+
             # create a windows to choose the release
             sub_title = 'In the list below, select the closest version that matches your project or engine version'
             ChoiceFromListWindow(
@@ -1302,44 +1315,63 @@ class UEVaultManagerCLI:
         print(f'UEVaultManager version "{UEVM_version}", codename "{UEVM_codename}"')
         exit_and_clean_windows(0)
 
+    @staticmethod
+    def get_full_help(parser=None) -> str:
+        """
+        Get the full help text, including the help of each command.
+        :param parser: command line parser. If not provided, gui_g.UEVM_parser_ref or a new full parser will be used.
+        :return: full help text.
+
+        Notes:
+            The text is built only once because formatting the help of all the parsers is slow.
+        """
+        if UEVaultManagerCLI._full_help_text:
+            return UEVaultManagerCLI._full_help_text
+        if parser is None and gui_g.UEVM_parser_ref is not None:
+            # a weak reference, it's None if the parser has been released by main()
+            parser = gui_g.UEVM_parser_ref()
+        if parser is None:
+            # the parser used by main() could only have the arguments of the command used, so a full one is built
+            parser, _ = build_parser()
+        parts = [parser.format_help()]
+        # Print the help for all the subparsers. Thanks stackoverflow!
+        parts.append('Individual command help:')
+        # noinspection PyProtectedMember,PyUnresolvedReferences
+        subparsers = next(a for a in parser._actions if isinstance(a, argparse._SubParsersAction))
+        # noinspection PyUnresolvedReferences
+        for choice, subparser in subparsers.choices.items():
+            if choice in hidden_help_commands:
+                continue
+            parts.append(f'\nCommand: {choice}')
+            parts.append(subparser.format_help())
+        UEVaultManagerCLI._full_help_text = '\n'.join(parts)
+        return UEVaultManagerCLI._full_help_text
+
     @staticmethod
     def print_help(args, parser=None, forced=False) -> None:
         """
         Prints the help for the command.
         :param args:.
-        :param parser: command line parser. If not provided, gui_g.UEVM_parser_ref will be used.
+        :param parser: command line parser. If not provided, gui_g.UEVM_parser_ref or a new full parser will be used.
         :param forced: whether the help will be printed even if the --help option is not present.
         """
-        if parser is None:
-            parser = gui_g.UEVM_parser_ref
-        if parser is None:
-            return
         uewm_gui_exists = False
 
         if args.full_help or forced:
             if UEVaultManagerCLI.is_gui:
                 uewm_gui_exists, _ = init_display_window()
-            custom_print(keep_mode=False, text=parser.format_help())
-
-            # Commands that should not be shown in full help/list of commands (e.g. aliases)
-            _hidden_commands = {'download', 'update', 'repair', 'get-token', 'verify-asset', 'list-assets'}
-            # Print the help for all the subparsers. Thanks stackoverflow!
-            custom_print(text='Individual command help:')
-            # noinspection PyProtectedMember,PyUnresolvedReferences
-            subparsers = next(a for a in parser._actions if isinstance(a, argparse._SubParsersAction))
-            # noinspection PyUnresolvedReferences
-            for choice, subparser in subparsers.choices.items():
-                if choice in _hidden_commands:
-                    continue
-                custom_print(text=f'\nCommand: {choice}')
-                custom_print(text=subparser.format_help())
+            # the full help is printed at once, each print in the display window rewrites all its content
+            custom_print(keep_mode=False, text=UEVaultManagerCLI.get_full_help(parser))
         elif os.name == 'nt':
             from UEVaultManager.lfs.windows_helpers import double_clicked
             if double_clicked():
-                custom_print(text='Please note that this is not the intended way to run UEVaultManager.')
-                custom_print(text='If you want to start it without arguments, you can start it in edit mode by default.')
-                custom_print(text='For that, you must set the line start_in_edit_mode=true in the configuration file.')
-                custom_print(text='More info on usage and configuration can be found in https://github.com/LaurentOngaro/UEVaultManager#readme')
+                custom_print(
+                    text='Please note that this is not the intended way to run UEVaultManager.\n'
+                    'If you want to start it without arguments, you can start it in edit mode by default.\n'
+                    'For that, you must set the line start_in_edit_mode=true in the configuration file.\n'
+                    'More info on usage and configuration can be found in https://github.com/LaurentOngaro/UEVaultManager#readme'
+                )
+                import subprocess  # only imported when needed
                 subprocess.Popen(['cmd', '/K', 'echo>nul'])
         else:
             # on non-windows systems
@@ -1361,98 +1393,48 @@ class UEVaultManagerCLI:
         json_print_key_val(self.core.open_manifest_file(file_path))
 
 
-def main():
+def _add_auth_arguments(parser) -> None:
     """
-    Main function.
+    Add the arguments of the 'auth' command to its parser.
+    :param parser: parser of the command.
     """
-    # Set output encoding to UTF-8 if not outputting to a terminal
-    try:
-        # noinspection PyUnresolvedReferences
-        sys.stdout.reconfigure(encoding='utf-8')
-    except (Exception, ):
-        pass
-    parser = argparse.ArgumentParser(description=f'UEVaultManager v{UEVM_version} - "{UEVM_codename}"')
-    parser.register('action', 'parsers', HiddenAliasSubparsersAction)
-
-    # general arguments
-    parser.add_argument('-H', '--full-help', dest='full_help', action='store_true', help='Show full help (including individual command help)')
-    parser.add_argument('-d', '--debug', dest='debug', action='store_true', help='Set loglevel to debug')
-    parser.add_argument('-y', '--yes', dest='yes', action='store_true', help='Default to yes for all prompts')
-    # noinspection DuplicatedCode
-    parser.add_argument('-V', '--version', dest='version', action='store_true', help='Print version and exit')
-    parser.add_argument('-T', '--runtest', dest='runtest', action='store_true', help='Run a test command using a CLI prompt. Just for developpers')
     parser.add_argument(
-        '-c', '--config-file', dest='config_file', action='store', metavar='<path/name>', help='Overwrite the default configuration file name to use'
-    )
-    parser.add_argument('-J', '--pretty-json', dest='pretty_json', action='store_true', help='Pretty-print JSON. Improve readability')
-    parser.add_argument(
-        '-A',
-        '--api-timeout',
-        dest='api_timeout',
-        action='store',
-        type=float,
-        default=(7, 7),
-        metavar='<seconds>',
-        help='API HTTP request timeout (default: 10 seconds)'
-    )  # timeout could be a float or a tuple  (connect timeout, read timeout) in s
-    parser.add_argument(
-        '-g', '--gui', dest='gui', action='store_true', help='Display additional information using gui elements like dialog boxes or progress window'
-    )
-    gui_g.UEVM_parser_ref = parser
-
-    # all the commands
-    subparsers = parser.add_subparsers(title='Commands', dest='subparser_name', metavar='<command>')
-    auth_parser = subparsers.add_parser('auth', help='Authenticate with the Epic Games Store')
-    clean_parser = subparsers.add_parser('cleanup', help='Remove old temporary, metadata, and manifest files')
-    info_parser = subparsers.add_parser('info', help='Prints info about specified asset or manifest')
-    list_parser = subparsers.add_parser('list', aliases=('list-assets', ), help='List owned assets')
-    list_files_parser = subparsers.add_parser('list-files', help='List files in manifest')
-    status_parser = subparsers.add_parser('status', help='Show UEVaultManager status information')
-    edit_parser = subparsers.add_parser('edit', aliases=('edit-assets', ), help='Edit the assets list file')
-    scrap_parser = subparsers.add_parser('scrap', aliases=('scrap-assets', ), help='Scrap all the available assets on the marketplace')
-    install_parser = subparsers.add_parser('install', aliases=('download', ), help='Download or Install an asset')
-    # hidden commands have no help text
-    get_token_parser = subparsers.add_parser('get-token')
-
-    # Positional arguments
-    install_parser.add_argument('app_name', nargs='?', metavar='<App Name>', help='Uid of the Asset to install')
-    list_files_parser.add_argument('app_name', nargs='?', metavar='<App Name>', help='Uid of the Asset to list files from')
-    info_parser.add_argument('app_name_or_manifest', help='Uid of the Asset to get info from or manifest path', metavar='<App Name/Manifest URI>')
-
-    # Flags for parsers
-    #####
-    auth_parser.add_argument(
         '--import', dest='import_egs_auth', action='store_true', help='Import Epic Games Launcher authentication data (logs out of EGL)'
     )
-    auth_parser.add_argument(
+    parser.add_argument(
         '--code',
         dest='auth_code',
         action='store',
         metavar='<authorization code>',
         help='Use specified authorization code instead of interactive authentication'
     )
-    auth_parser.add_argument(
+    parser.add_argument(
         '--token',
         dest='ex_token',
         action='store',
         metavar='<exchange token>',
         help='Use specified exchange token instead of interactive authentication'
     )
-    auth_parser.add_argument(
+    parser.add_argument(
         '--sid', dest='session_id', action='store', metavar='<session id>', help='Use specified session id instead of interactive authentication'
     )
-    auth_parser.add_argument('--delete', dest='auth_delete', action='store_true', help='Remove existing authentication (log out)')
-    auth_parser.add_argument('--disable-webview', dest='no_webview', action='store_true', help='Do not use embedded browser for login')
+    parser.add_argument('--delete', dest='auth_delete', action='store_true', help='Remove existing authentication (log out)')
+    parser.add_argument('--disable-webview', dest='no_webview', action='store_true', help='Do not use embedded browser for login')
+
 
-    ######
-    clean_parser.add_argument(
+def _add_cleanup_arguments(parser) -> None:
+    """
+    Add the arguments of the 'cleanup' command to its parser.
+    :param parser: parser of the command.
+    """
+    parser.add_argument(
         '-cs,'
         '--delete-scraping-data',
         dest='delete_scraping_data',
         action='store_true',
         help='Also delete scraping data files. They are kept by default'
     )
-    clean_parser.add_argument(
+    parser.add_argument(
         '-cc,'
         '--delete-cache-data',
         dest='delete_cache_data',
@@ -1460,76 +1442,103 @@ def main():
         help='Also delete image asset previews. They are usefull and should be kept. They are kept by default'
     )
     # noinspection DuplicatedCode
-    clean_parser.add_argument('-g', '--gui', dest='gui', action='store_true', help='Display the output in a windows instead of using the console')
+    parser.add_argument('-g', '--gui', dest='gui', action='store_true', help='Display the output in a windows instead of using the console')
+
 
-    ######
-    info_parser.add_argument(
+def _add_info_arguments(parser) -> None:
+    """
+    Add the arguments of the 'info' command to its parser.
+    :param parser: parser of the command.
+    """
+    parser.add_argument('app_name_or_manifest', help='Uid of the Asset to get info from or manifest path', metavar='<App Name/Manifest URI>')
+    parser.add_argument(
         '--offline', dest='offline', action='store_true', help='Only print info available offline. It will use files saved previously, do not log in'
     )
-    info_parser.add_argument('--json', dest='json', action='store_true', help='Output information in JSON format')
-    info_parser.add_argument('-a', '--all', dest='all', action='store_true', help='Display all the information even if non-relevant for an asset')
-    info_parser.add_argument('-g', '--gui', dest='gui', action='store_true', help='Display the output in a windows instead of using the console')
+    parser.add_argument('--json', dest='json', action='store_true', help='Output information in JSON format')
+    parser.add_argument('-a', '--all', dest='all', action='store_true', help='Display all the information even if non-relevant for an asset')
+    parser.add_argument('-g', '--gui', dest='gui', action='store_true', help='Display the output in a windows instead of using the console')
+
 
-    #####
+def _add_list_arguments(parser) -> None:
+    """
+    Add the arguments of the 'list' command to its parser.
+    :param parser: parser of the command.
+    """
     # noinspection DuplicatedCode
-    list_parser.add_argument('--csv', dest='csv', action='store_true', help='Output in CSV format')
-    list_parser.add_argument('--tsv', dest='tsv', action='store_true', help='Output in TSV format')
-    list_parser.add_argument('--json', dest='json', action='store_true', help='Output in JSON format')
-    list_parser.add_argument(
+    parser.add_argument('--csv', dest='csv', action='store_true', help='Output in CSV format')
+    parser.add_argument('--tsv', dest='tsv', action='store_true', help='Output in TSV format')
+    parser.add_argument('--json', dest='json', action='store_true', help='Output in JSON format')
+    parser.add_argument(
         '-f',
         '--force-refresh',
         dest='force_refresh',
         action='store_true',
         help="Force a refresh of all asset's metadata. It could take some time ! If not forced, the cached data will be used"
     )
-    list_parser.add_argument(
+    parser.add_argument(
         '--offline', dest='offline', action='store_true', help='Only print info available offline. It will use files saved previously, do not log in'
     )
-    list_parser.add_argument(
+    parser.add_argument(
         '-fc',
         '--filter-category',
         dest='filter_category',
         action='store',
         help='Filter assets by category. Search against the asset category in the marketplace. Search is case-insensitive and can be partial'
     )
-    list_parser.add_argument(
+    parser.add_argument(
         '-o', '--output', dest='output', metavar='<path/name>', action='store', help='The file name (with path) where the list should be written'
     )
-    list_parser.add_argument(
+    parser.add_argument(
         '-g', '--gui', dest='gui', action='store_true', help='Display additional information using gui elements like dialog boxes or progress window'
     )
 
-    #####
+
+def _add_list_files_arguments(parser) -> None:
+    """
+    Add the arguments of the 'list-files' command to its parser.
+    :param parser: parser of the command.
+    """
+    parser.add_argument('app_name', nargs='?', metavar='<App Name>', help='Uid of the Asset to list files from')
     # noinspection DuplicatedCode
-    list_files_parser.add_argument(
+    parser.add_argument(
         '--manifest', dest='override_manifest', action='store', metavar='<uri>', help='Manifest URL or path to use instead of the CDN one'
     )
-    list_files_parser.add_argument('--csv', dest='csv', action='store_true', help='Output in CSV format')
-    list_files_parser.add_argument('--tsv', dest='tsv', action='store_true', help='Output in TSV format')
-    list_files_parser.add_argument('--json', dest='json', action='store_true', help='Output in JSON format')
+    parser.add_argument('--csv', dest='csv', action='store_true', help='Output in CSV format')
+    parser.add_argument('--tsv', dest='tsv', action='store_true', help='Output in TSV format')
+    parser.add_argument('--json', dest='json', action='store_true', help='Output in JSON format')
     # noinspection DuplicatedCode
-    list_files_parser.add_argument(
+    parser.add_argument(
         '--hashlist', dest='hashlist', action='store_true', help='Output file hash list in hash Check/sha1 sum -c compatible format'
     )
-    list_files_parser.add_argument(
+    parser.add_argument(
         '-g', '--gui', dest='gui', action='store_true', help='Display the output in a windows instead of using the console'
     )
 
-    #####
-    status_parser.add_argument('--offline', dest='offline', action='store_true', help='Only print offline status information, do not log in')
+
+def _add_status_arguments(parser) -> None:
+    """
+    Add the arguments of the 'status' command to its parser.
+    :param parser: parser of the command.
+    """
+    parser.add_argument('--offline', dest='offline', action='store_true', help='Only print offline status information, do not log in')
     # noinspection DuplicatedCode
-    status_parser.add_argument('--json', dest='json', action='store_true', help='Show status in JSON format')
-    status_parser.add_argument(
+    parser.add_argument('--json', dest='json', action='store_true', help='Show status in JSON format')
+    parser.add_argument(
         '-f',
         '--force-refresh',
         dest='force_refresh',
         action='store_true',
         help="Force a refresh of all asset's metadata. It could take some time ! If not forced, the cached data will be used"
     )
-    status_parser.add_argument('-g', '--gui', dest='gui', action='store_true', help='Display the output in a windows instead of using the console')
+    parser.add_argument('-g', '--gui', dest='gui', action='store_true', help='Display the output in a windows instead of using the console')
 
-    ######
-    edit_parser.add_argument(
+
+def _add_edit_arguments(parser) -> None:
+    """
+    Add the arguments of the 'edit' command to its parser.
+    :param parser: parser of the command.
+    """
+    parser.add_argument(
         '-i',
         '--input',
         dest='input',
@@ -1537,7 +1546,7 @@ def main():
         action='store',
         help='The file name (with path) where the list should be read from (it exludes the --database option)'
     )
-    edit_parser.add_argument(
+    parser.add_argument(
         '-db',
         '--database',
         dest='database',
@@ -1546,15 +1555,21 @@ def main():
         help='The sqlite file name (with path) where the list should be read from (it exludes the --input option)'
     )
     # noinspection DuplicatedCode
-    edit_parser.add_argument(
+    parser.add_argument(
         '--offline', dest='offline', action='store_true', help='Only edit info available offline. It will use files saved previously, do not log in'
     )
     # not use for now
-    # edit_parser.add_argument('--csv', dest='csv', action='store_true', help='Input file is in CSV format')
-    # edit_parser.add_argument('--tsv', dest='tsv', action='store_true', help='Input file is in TSV format')
-    # edit_parser.add_argument('--json', dest='json', action='store_true', help='Input file is in JSON format')
-    ######
-    scrap_parser.add_argument(
+    # parser.add_argument('--csv', dest='csv', action='store_true', help='Input file is in CSV format')
+    # parser.add_argument('--tsv', dest='tsv', action='store_true', help='Input file is in TSV format')
+    # parser.add_argument('--json', dest='json', action='store_true', help='Input file is in JSON format')
+
+
+def _add_scrap_arguments(parser) -> None:
+    """
+    Add the arguments of the 'scrap' command to its parser.
+    :param parser: parser of the command.
+    """
+    parser.add_argument(
         '-f',
         '--force-refresh',
         dest='force_refresh',
@@ -1562,23 +1577,29 @@ def main():
         help="Force a refresh of all asset's data. It could take some time ! If not forced, the cached data will be used"
     )
     # noinspection DuplicatedCode
-    scrap_parser.add_argument(
+    parser.add_argument(
         '--offline', dest='offline', action='store_true', help='Use previous saved data files (json) instead of scapping and new data, do not log in'
     )
-    scrap_parser.add_argument(
+    parser.add_argument(
         '-fc',
         '--filter-category',
         dest='filter_category',
         action='store',
         help='Filter assets by category. Search against the asset category in the marketplace. Search is case-insensitive and can be partial'
     )
-    scrap_parser.add_argument('-g', '--gui', dest='gui', action='store_true', help='Display the output in a windows instead of using the console')
+    parser.add_argument('-g', '--gui', dest='gui', action='store_true', help='Display the output in a windows instead of using the console')
+
 
-    ######
-    install_parser.add_argument(
+def _add_install_arguments(parser) -> None:
+    """
+    Add the arguments of the 'install' command to its parser.
+    :param parser: parser of the command.
+    """
+    parser.add_argument('app_name', nargs='?', metavar='<App Name>', help='Uid of the Asset to install')
+    parser.add_argument(
         '-i', '--install-path', dest='install_path', action='store', metavar='<path>', help='Path where the Asset will be installed'
     )
-    install_parser.add_argument(
+    parser.add_argument(
         '-dp',
         '--download-path',
         dest='download_path',
@@ -1586,14 +1607,14 @@ def main():
         metavar='<path>',
         help='Path where the Asset will be downloaded. If empty, the Epic launcher Vault cache will be used.'
     )
-    install_parser.add_argument(
+    parser.add_argument(
         '-f',
         '--force-refresh',
         dest='force_refresh',
         action='store_true',
         help="Force a refresh of all asset's data. It could take some time ! If not forced, the cached data will be used"
     )
-    install_parser.add_argument(
+    parser.add_argument(
         '-vc',
         '--vault-cache',
         dest='vault_cache',
@@ -1601,14 +1622,14 @@ def main():
         help='Use the vault cache folder to store the downloaded asset. It uses Epic Game Launcher setting to get this value.'  #
         + 'In that case, the download_path option will be ignored'
     )
-    install_parser.add_argument(
+    parser.add_argument(
         '-c',
         '--clean-dowloaded-data',
         dest='clean_dowloaded_data',
         action='store_true',
         help='Delete the folder with dowloaded data. Keep the installed version if it has been installed.'
     )
-    install_parser.add_argument(
+    parser.add_argument(
         '--max-shared-memory',
         dest='shared_memory',
         action='store',
@@ -1616,7 +1637,7 @@ def main():
         type=int,
         help='Maximum amount of shared memory to use (in MiB), default: 1 GiB'
     )
-    install_parser.add_argument(
+    parser.add_argument(
         '--max-workers',
         dest='max_workers',
         action='store',
@@ -1624,40 +1645,40 @@ def main():
         type=int,
         help='Maximum amount of download workers, default: min(2 * CPUs, 16)'
     )
-    install_parser.add_argument(
+    parser.add_argument(
         '--manifest',
         dest='override_manifest',
         action='store',
         metavar='<uri>',
         help='Manifest URL or path to use instead of the CDN one (e.g. for downgrading)'
     )
-    install_parser.add_argument(
+    parser.add_argument(
         '--base-url',
         dest='override_base_url',
         action='store',
         metavar='<url>',
         help='Base URL to download from (e.g. to test or switch to a different CDNs)'
     )
-    install_parser.add_argument('--no-resume', dest='no_resume', action='store_true', help='Force Download all files / ignore resume')
-    install_parser.add_argument('--download-only', '--no-install', dest='no_install', action='store_true', help='Do not install asset after download')
-    install_parser.add_argument(
+    parser.add_argument('--no-resume', dest='no_resume', action='store_true', help='Force Download all files / ignore resume')
+    parser.add_argument('--download-only', '--no-install', dest='no_install', action='store_true', help='Do not install asset after download')
+    parser.add_argument(
         '-r',
         '--reuse-last-install',
         dest='reuse_last_install',
         action='store_true',
         help='If the asset has been previouly installed, the installation folder will be reused. In that case, the install-path option will be ignored'
     )
-    install_parser.add_argument(
+    parser.add_argument(
         '--dlm-debug', dest='dlm_debug', action='store_true', help='Set download manager and worker processes\' loglevel to debug'
     )
-    install_parser.add_argument(
+    parser.add_argument(
         '--enable-reordering',
         dest='order_opt',
         action='store_true',
         help='Enable reordering optimization to reduce RAM requirements '
         'during download (may have adverse results for some titles)'
     )
-    install_parser.add_argument(
+    parser.add_argument(
         '--timeout',
         dest='timeout',
         action='store',
@@ -1665,35 +1686,224 @@ def main():
         type=int,
         help='Connection and read timeout for downloader (default: 10 seconds)'
     )
-    install_parser.add_argument(
+    parser.add_argument(
         '--ignore-free-space', dest='ignore_free_space', action='store_true', help='Do not abort if not enough free space is available'
     )
-    install_parser.add_argument(
+    parser.add_argument(
         '--preferred-cdn',
         dest='preferred_cdn',
         action='store',
         metavar='<hostname>',
         help='Set the hostname of the preferred CDN to use when available'
     )
-    install_parser.add_argument(
+    parser.add_argument(
         '--no-https', dest='disable_https', action='store_true', help='Download games via plaintext HTTP (like EGS), e.g. for use with a lan cache'
     )
 
-    ######
-    get_token_parser.add_argument('--json', dest='json', action='store_true', help='Output information in JSON format')
-    get_token_parser.add_argument('--bearer', dest='bearer', action='store_true', help='Return fresh bearer token rather than an exchange code')
 
-    # Note: this line prints the full help and quit if not other command is available
-    args, extra = parser.parse_known_args()
+def _add_get_token_arguments(parser) -> None:
+    """
+    Add the arguments of the 'get-token' command to its parser.
+    :param parser: parser of the command.
+    """
+    parser.add_argument('--json', dest='json', action='store_true', help='Output information in JSON format')
+    parser.add_argument('--bearer', dest='bearer', action='store_true', help='Return fresh bearer token rather than an exchange code')
+
+
+# name, aliases, help and function that adds the arguments, for each command. Commands without help are hidden
+_commands_definition = (
+    ('auth', (), 'Authenticate with the Epic Games Store', _add_auth_arguments),
+    ('cleanup', (), 'Remove old temporary, metadata, and manifest files', _add_cleanup_arguments),
+    ('info', (), 'Prints info about specified asset or manifest', _add_info_arguments),
+    ('list', ('list-assets', ), 'List owned assets', _add_list_arguments),
+    ('list-files', (), 'List files in manifest', _add_list_files_arguments),
+    ('status', (), 'Show UEVaultManager status information', _add_status_arguments),
+    ('edit', ('edit-assets', ), 'Edit the assets list file', _add_edit_arguments),
+    ('scrap', ('scrap-assets', ), 'Scrap all the available assets on the marketplace', _add_scrap_arguments),
+    ('install', ('download', ), 'Download or Install an asset', _add_install_arguments),
+    ('get-token', (), None, _add_get_token_arguments),
+)
+# name of the UEVaultManagerCLI method to call for each command, and True if the command needs the GUI
+_commands_dispatch = {
+    'auth': ('auth', False),
+    'cleanup': ('cleanup', False),
+    'info': ('info', False),
+    'list': ('list_assets', False),
+    'list-files': ('list_files', False),
+    'status': ('status', False),
+    'edit': ('edit', True),
+    'scrap': ('scrap_assets', True),
+    'install': ('install_asset', False),
+    'get-token': ('get_token', False),
+}
+# the aliases of a command call the same method
+_commands_dispatch.update({alias: _commands_dispatch[name] for name, aliases, _, _ in _commands_definition for alias in aliases})
+# general options that are followed by a value, used to find the command name in the command line
+_general_options_with_value = ('-c', '--config-file', '-A', '--api-timeout')
+# letters of the short general options that are followed by a value
+_short_flags_with_value = tuple(option[1] for option in _general_options_with_value if len(option) == 2)
+
+
+def _get_short_flags(option: str) -> str:
+    """
+    Get the letters of a group of short options, without the value attached to the last one.
+    :param option: option of the command line (ex: '-dV' or '-cuevm.ini').
+    :return: letters of the short options (ex: 'dV' or 'c'), or '' if the option is not a short one.
+    Notes:
+        The rest of the group after a letter that takes a value is its value (ex: '-cV.ini' is '-c V.ini').
+    """
+    if not option.startswith('-') or option.startswith('--'):
+        return ''
+    flags = ''
+    for letter in option[1:]:
+        flags += letter
+        if letter in _short_flags_with_value:
+            break
+    return flags
 
-    cli = UEVaultManagerCLI(override_config=args.config_file, api_timeout=args.api_timeout)
 
-    if args.version:
+def _split_argv(argv: list) -> (list, str):
+    """
+    Split the arguments of the command line before the command name, without parsing them.
+    :param argv: arguments of the command line (without the program name).
+    :return: (list of the general options given before the command, name (or alias) of the command or '' if no command is given).
+    """
+    options = []
+    skip_value = False
+    for arg in argv:
+        if skip_value:
+            skip_value = False
+        elif arg in _general_options_with_value:
+            skip_value = True
+        elif arg.startswith('-'):
+            options.append(arg)
+            # a group of short options ending with an option that takes a value (ex: -dc) is followed by the value
+            flags = _get_short_flags(arg)
+            skip_value = flags != '' and flags == arg[1:] and flags[-1] in _short_flags_with_value
+        else:
+            return options, arg
+    return options, ''
+
+
+def _is_option_in(options: list, short_flag: str, long_option: str) -> bool:
+    """
+    Check if an option is in a list of general options.
+    :param options: list of general options, as returned by _split_argv().
+    :param short_flag: letter of the short option (ex: 'H' for '-H').
+    :param long_option: long option (ex: '--full-help').
+    :return: True if the option is in the list.
+    """
+    for option in options:
+        if option.startswith('--'):
+            # the long options could be abbreviated by argparse
+            if len(option) > 2 and long_option.startswith(option):
+                return True
+        elif short_flag in _get_short_flags(option):
+            # the short options could be grouped (ex: -dH)
+            return True
+    return False
+
+
+def get_command_name_from_argv(argv: list) -> str:
+    """
+    Get the name of the command given in the command line, without parsing it.
+    :param argv: arguments of the command line (without the program name).
+    :return: name (or alias) of the command, or '' if no command is given or if the full help is asked.
+    """
+    options, command_name = _split_argv(argv)
+    return '' if _is_option_in(options, 'H', '--full-help') else command_name
+
+
+def is_version_asked(argv: list) -> bool:
+    """
+    Check if the version is asked in the command line, without parsing it.
+    :param argv: arguments of the command line (without the program name).
+    :return: True if the -V or --version option is given before the command.
+    """
+    options, _ = _split_argv(argv)
+    return _is_option_in(options, 'V', '--version')
+
+
+def build_parser(command_name: str = '') -> (argparse.ArgumentParser, dict):
+    """
+    Build the command line parser.
+    :param command_name: name (or alias) of the command used. If empty or unknown, the arguments of all the commands are added.
+    :return: (parser, dict of the command parsers by command name).
+
+    Notes:
+        All the commands are added to the parser (for the commands list and the validation), but adding all their arguments is the longest part.
+        So, only the arguments of the command used are added when its name is known.
+    """
+    parser = argparse.ArgumentParser(description=f'UEVaultManager v{UEVM_version} - "{UEVM_codename}"')
+    parser.register('action', 'parsers', HiddenAliasSubparsersAction)
+
+    # general arguments
+    parser.add_argument('-H', '--full-help', dest='full_help', action='store_true', help='Show full help (including individual command help)')
+    parser.add_argument('-d', '--debug', dest='debug', action='store_true', help='Set loglevel to debug')
+    parser.add_argument('-y', '--yes', dest='yes', action='store_true', help='Default to yes for all prompts')
+    # noinspection DuplicatedCode
+    parser.add_argument('-V', '--version', dest='version', action='store_true', help='Print version and exit')
+    parser.add_argument('-T', '--runtest', dest='runtest', action='store_true', help='Run a test command using a CLI prompt. Just for developpers')
+    parser.add_argument(
+        '-c', '--config-file', dest='config_file', action='store', metavar='<path/name>', help='Overwrite the default configuration file name to use'
+    )
+    parser.add_argument('-J', '--pretty-json', dest='pretty_json', action='store_true', help='Pretty-print JSON. Improve readability')
+    parser.add_argument(
+        '-A',
+        '--api-timeout',
+        dest='api_timeout',
+        action='store',
+        type=float,
+        default=(7, 7),
+        metavar='<seconds>',
+        help='API HTTP request timeout (default: 10 seconds)'
+    )  # timeout could be a float or a tuple  (connect timeout, read timeout) in s
+    parser.add_argument(
+        '-g', '--gui', dest='gui', action='store_true', help='Display additional information using gui elements like dialog boxes or progress window'
+    )
+
+    # all the commands
+    subparsers = parser.add_subparsers(title='Commands', dest='subparser_name', metavar='<command>')
+    is_known_command = any(command_name == name or command_name in aliases for name, aliases, _, _ in _commands_definition)
+    command_parsers = {}
+    for name, aliases, help_text, add_arguments in _commands_definition:
+        # hidden commands have no help text
+        if help_text is None:
+            command_parser = subparsers.add_parser(name, aliases=aliases)
+        else:
+            command_parser = subparsers.add_parser(name, aliases=aliases, help=help_text)
+        if not is_known_command or command_name == name or command_name in aliases:
+            add_arguments(command_parser)
+        command_parsers[name] = command_parser
+    return parser, command_parsers
+
+
+def main():
+    """
+    Main function.
+    """
+    # Set output encoding to UTF-8 if not outputting to a terminal
+    try:
+        # noinspection PyUnresolvedReferences
+        sys.stdout.reconfigure(encoding='utf-8')
+    except (Exception, ):
+        pass
+    # the version is printed before building the parser, it's the longest part of the start
+    if is_version_asked(sys.argv[1:]):
         UEVaultManagerCLI.print_version()
         return
+    command_name = get_command_name_from_argv(sys.argv[1:])
+    parser, command_parsers = build_parser(command_name)
+    # only keep a parser with the arguments of all the commands, it's used to print the full help from the GUI
+    # it's a weak reference, so it does not keep the parser alive when main() releases it
+    gui_g.UEVM_parser_ref = None if command_name else weakref.ref(parser)
 
-    if args.runtest:
-        cli.run_test(args)
+    # Note: this line prints the full help and quit if not other command is available
+    args, extra = parser.parse_known_args()
+
+    # the options that don't need the core (and its config, api and files loading) are handled before creating it
+    if args.version:
+        UEVaultManagerCLI.print_version()
         return
 
     try:
@@ -1701,15 +1911,27 @@ def main():
     except (AttributeError, KeyError):
         UEVaultManagerCLI.is_gui = False
 
-    start_in_edit_mode = str_to_bool(cli.core.uevmlfs.config.get('UEVaultManager', 'start_in_edit_mode', fallback=False))
+    if args.full_help:
+        UEVaultManagerCLI.print_help(args=args, parser=parser)
+        return
+
+    cli = UEVaultManagerCLI(override_config=args.config_file, api_timeout=args.api_timeout)
+
+    if args.runtest:
+        cli.run_test(args)
+        return
+
+    # get the config section only once, its values are still interpolated only when they are read
+    cfg = cli.core.uevmlfs.config['UEVaultManager']
+    start_in_edit_mode = str_to_bool(cfg.get('start_in_edit_mode', False))
 
-    if (not start_in_edit_mode and args.subparser_name is None) or args.full_help:
+    if not start_in_edit_mode and args.subparser_name is None:
         UEVaultManagerCLI.print_help(args=args, parser=parser)
         return
 
     ql = cli.setup_threaded_logging()
 
-    conf_log_level = cli.core.uevmlfs.config.get('UEVaultManager', 'log_level', fallback='info')
+    conf_log_level = cfg.get('log_level', 'info')
     conf_log_level = conf_log_level.lower()
     if conf_log_level == 'debug' or args.debug:
         cli.core.verbose_mode = True
@@ -1719,18 +1941,16 @@ def main():
         logging.getLogger('requests').setLevel(logging.WARNING)
         logging.getLogger('urllib3').setLevel(logging.WARNING)
 
-    cli.core.create_output_backup = str_to_bool(cli.core.uevmlfs.config.get('UEVaultManager', 'create_output_backup', fallback=True))
-    cli.core.create_log_backup = str_to_bool(cli.core.uevmlfs.config.get('UEVaultManager', 'create_log_backup', fallback=True))
-    cli.core.verbose_mode = str_to_bool(cli.core.uevmlfs.config.get('UEVaultManager', 'verbose_mode', fallback=False))
+    cli.core.create_output_backup = str_to_bool(cfg.get('create_output_backup', True))
+    cli.core.create_log_backup = str_to_bool(cfg.get('create_log_backup', True))
+    cli.core.verbose_mode = str_to_bool(cfg.get('verbose_mode', False))
 
-    cli.core.ignored_assets_filename_log = cli.core.uevmlfs.config.get('UEVaultManager', 'ignored_assets_filename_log', fallback='')
-    cli.core.notfound_assets_filename_log = cli.core.uevmlfs.config.get('UEVaultManager', 'notfound_assets_filename_log', fallback='')
-    cli.core.scan_assets_filename_log = cli.core.uevmlfs.config.get('UEVaultManager', 'scan_assets_filename_log', fallback='')
-    cli.core.scrap_assets_filename_log = cli.core.uevmlfs.config.get('UEVaultManager', 'scrap_assets_filename_log', fallback='')
+    cli.core.ignored_assets_filename_log = cfg.get('ignored_assets_filename_log', '')
+    cli.core.notfound_assets_filename_log = cfg.get('notfound_assets_filename_log', '')
+    cli.core.scan_assets_filename_log = cfg.get('scan_assets_filename_log', '')
+    cli.core.scrap_assets_filename_log = cfg.get('scrap_assets_filename_log', '')
 
-    cli.core.engine_version_for_obsolete_assets = cli.core.uevmlfs.config.get(
-        'UEVaultManager', 'engine_version_for_obsolete_assets', fallback=gui_g.s.engine_version_for_obsolete_assets
-    )
+    cli.core.engine_version_for_obsolete_assets = cfg.get('engine_version_for_obsolete_assets', gui_g.s.engine_version_for_obsolete_assets)
 
     # copy the name of the config file used to the gui global variable
     gui_g.s.config_file = cli.core.uevmlfs.config_file
@@ -1742,41 +1962,28 @@ def main():
     # open log files for assets if necessary
     cli.core.setup_assets_loggers()
 
+    # the main parser is no more used, release it before running the command (the GUI can run for a long time)
+    del parser
+
     # technically args.func() with set defaults could work (see docs on subparsers)
     # but that would require all funcs to accept args and extra...
     try:
-        if args.subparser_name == 'auth':
-            cli.auth(args)
-        elif args.subparser_name == 'cleanup':
-            cli.cleanup(args)
-        elif args.subparser_name == 'info':
-            cli.info(args)
-        elif args.subparser_name in {'list', 'list-assets'}:
-            cli.list_assets(args)
-        elif args.subparser_name == 'list-files':
-            cli.list_files(args)
-        elif args.subparser_name == 'status':
-            cli.status(args)
-        elif args.subparser_name in {'edit', 'edit-assets'}:
-            if args.database and args.input:
-                remove_command_argument(edit_parser, 'input')
-            args.gui = True
-            UEVaultManagerCLI.is_gui = True
-            cli.edit(args)
-        elif args.subparser_name in {'scrap', 'scrap-assets'}:
-            args.gui = True
-            UEVaultManagerCLI.is_gui = True
-            cli.scrap_assets(args)
-        elif args.subparser_name in {'download', 'install'}:
-            cli.install_asset(args)
-        elif args.subparser_name == 'get-token':
-            cli.get_token(args)
-        elif start_in_edit_mode:
+        method_name, needs_gui = _commands_dispatch.get(args.subparser_name, ('', False))
+        edit_by_default = not method_name and start_in_edit_mode
+        if edit_by_default:
+            args.subparser_name = 'edit'
+            method_name, needs_gui = _commands_dispatch['edit']
+        elif method_name == 'edit' and args.database and args.input:
+            remove_command_argument(command_parsers['edit'], 'input')
+        if needs_gui:
             args.gui = True
             UEVaultManagerCLI.is_gui = True
-            args.subparser_name = 'edit'
+        if edit_by_default:
+            from UEVaultManager.tkgui.main import init_gui
+
             args.input = init_gui(False)
-            cli.edit(args)
+        if method_name:
+            getattr(cli, method_name)(args)
     except KeyboardInterrupt:
         cli.logger.info('Command was aborted via KeyboardInterrupt, cleaning up...')
 
@@ -1792,12 +1999,15 @@ def main():
     # show note if update is available
     if not disable_update_message and cli.core.update_available and cli.core.update_notice_enabled():
         if update_info := cli.core.get_update_info():
-            print(f'\nAn update available!')
-            print(f'- New version: {update_info["version"]} - "{update_info["codename"]}"')
-            print(f'- Release summary:\n{update_info["summary"]}')
+            # the lines are printed at once
+            lines = [
+                '\nAn update available!', f'- New version: {update_info["version"]} - "{update_info["codename"]}"',
+                f'- Release summary:\n{update_info["summary"]}'
+            ]
             if update_info['severity'] == UpdateSeverity.HIGH.name:
-                print('! This update is recommended as it fixes major issues.')
-                print(f'\n- Release URL: {update_info["release_url"]}')
+                lines.append('! This update is recommended as it fixes major issues.')
+                lines.append(f'\n- Release URL: {update_info["release_url"]}')
+            print('\n'.join(lines))
     ql.stop()
     cli.logger.info('Nothing else to do. Application terminated.')
     cli.core.clean_exit(0)
@@ -1805,5 +2015,7 @@ def main():
 
 if __name__ == '__main__':
     # required for pyinstaller on Windows, does nothing on other platforms.
-    freeze_support()
+    if sys.platform == 'win32':
+        from multiprocessing import freeze_support
+        freeze_support()
     main()
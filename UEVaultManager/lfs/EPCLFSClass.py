@@ -13,9 +13,9 @@ class EPCLFS:
     """
     Epic Games Encrypted Config Filesystem Class.
     """
-    data_keys = []
 
     def __init__(self):
+        self.data_keys = []
         self.manifests = {}
         self.is_windows = os.name == 'nt'
         if self.is_windows:
@@ -510,6 +510,9 @@ class UEVMLFS:
             return 0
         if file_name_to_keep is None:
             file_name_to_keep = []
+        # make extensions_to_delete lower, only once for all the files
+        if extensions_to_delete is not None:
+            extensions_to_delete = [ext.lower() for ext in extensions_to_delete]
         size_deleted = 0
         while folders_to_clean:
             folder = folders_to_clean.pop()
@@ -518,25 +521,23 @@ class UEVMLFS:
                 continue
             if not os.path.isdir(folder):
                 continue
-            for f in os.listdir(folder):
-                file_name = path_join(folder, f)
-                # file_name = os.path.abspath(file_name)
-                app_name, file_ext = os.path.splitext(f)
-                file_ext = file_ext.lower()
-                # make extensions_to_delete lower
-                if extensions_to_delete is not None:
-                    extensions_to_delete = [ext.lower() for ext in extensions_to_delete]
-                file_is_ok = (file_name_to_keep is None or app_name not in file_name_to_keep)
-                ext_is_ok = (extensions_to_delete is None or file_ext in extensions_to_delete)
-                if file_is_ok and ext_is_ok:
-                    try:
-                        size = os.path.getsize(file_name)
-                        os.remove(file_name)
-                        size_deleted += size
-                    except Exception as error:
-                        self.logger.warning(f'Failed to delete file "{file_name}": {error!r}')
-                elif os.path.isdir(file_name):
-                    folders_to_clean.append(file_name)
+            # os.scandir() is used to get the size and the type of each entry without extra stat() calls
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    file_name = path_join(folder, entry.name)
+                    app_name, file_ext = os.path.splitext(entry.name)
+                    file_ext = file_ext.lower()
+                    file_is_ok = (file_name_to_keep is None or app_name not in file_name_to_keep)
+                    ext_is_ok = (extensions_to_delete is None or file_ext in extensions_to_delete)
+                    if file_is_ok and ext_is_ok:
+                        try:
+                            size = entry.stat().st_size
+                            os.remove(file_name)
+                            size_deleted += size
+                        except Exception as error:
+                            self.logger.warning(f'Failed to delete file "{file_name}": {error!r}')
+                    elif entry.is_dir():
+                        folders_to_clean.append(file_name)
         return size_deleted
 
     def load_manifest(self, app_name: str, version: str, platform: str = 'Windows') -> any:
@@ -905,10 +906,7 @@ class UEVMLFS:
             installed_folders = installed_folders_ori.copy() if installed_folders_ori is not None else None
             if installed_folders:
                 catalog_item_id = asset.get('catalog_item_id', None)
-                if merged_installed_folders.get(catalog_item_id, None) is None:
-                    merged_installed_folders[catalog_item_id] = installed_folders
-                else:
-                    merged_installed_folders[catalog_item_id].extend(installed_folders)
+                merged_installed_folders.setdefault(catalog_item_id, []).extend(installed_folders)
             else:
                 # the installed_folders field is empty for the installed_assets, we remove it from the json file
                 self.remove_installed_asset(app_name)
@@ -27,7 +27,20 @@ def get_dir_size(path: str) -> int:
     :param path: path to the directory.
     :return: size of the directory.
     """
-    return sum(f.stat().st_size for f in Path(path).glob('**/*') if f.is_file())
+    # os.scandir() gets the file type when listing the folder, so only the files are stat-ed (once)
+    size = 0
+    folders_to_scan = [path]
+    while folders_to_scan:
+        try:
+            with os.scandir(folders_to_scan.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        folders_to_scan.append(entry.path)
+                    elif entry.is_file():
+                        size += entry.stat().st_size
+        except OSError:
+            continue
+    return size
 
 
 def path_join(*paths):
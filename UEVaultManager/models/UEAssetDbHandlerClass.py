@@ -81,6 +81,8 @@ class UEAssetDbHandler:
     logger = logging.getLogger(__name__.split('.')[-1])  # keep only the class name
     update_loggers_level(logger)
     db_version: DbVersionNum = DbVersionNum.V0  # updated in check_and_upgrade_database()
+    # table names and columns of each database, shared by all the instances. Cleared when the schema is changed by this class
+    _schema_cache: dict = {}
 
     def __init__(self, database_name: str, reset_database: bool = False):
         self.connection = None
@@ -180,6 +182,19 @@ class UEAssetDbHandler:
             self.logger.info(f'database version is now set to {new_version}')
             self.logger.info(f'Old version has been saved in {backup}')
 
+    def _get_schema_cache(self) -> dict:
+        """
+        Get the cached schema data of the database.
+        :return: dict with the cached schema data of the database. Created if it doesn't exist.
+        """
+        return self._schema_cache.setdefault(self.database_name, {'tables': None, 'columns': {}})
+
+    def _clear_schema_cache(self) -> None:
+        """
+        Clear the cached schema data of the database. Must be called after any change in the tables structure.
+        """
+        self._schema_cache.pop(self.database_name, None)
+
     def _check_db_version(self, minimal_db_version: DbVersionNum, caller_name: str = 'this method') -> bool:
         """
         Check if the database version is compatible with the current method.
@@ -212,6 +227,7 @@ class UEAssetDbHandler:
                     cursor.execute(query)
             self.connection.commit()
             cursor.close()
+            self._clear_schema_cache()
 
     def run_query(self, query: str, data: dict = None) -> list:
         """
@@ -325,6 +341,7 @@ class UEAssetDbHandler:
         Create the tables if they don't exist.
         :param upgrade_to_version: database version we want to upgrade TO.
         """
+        self._clear_schema_cache()
         # all the following steps must be run sequentially
         if upgrade_to_version.value >= DbVersionNum.V1.value:
             if self.connection is not None:
@@ -504,11 +521,13 @@ class UEAssetDbHandler:
                 id          INTEGER PRIMARY KEY AUTOINCREMENT
             );"""
             self.run_query(query)
+            self._clear_schema_cache()
             self.db_version = upgrade_from_version = DbVersionNum.V10
         if upgrade_from_version == DbVersionNum.V10:
             column = 'installed_folder'  # use a var to avoid issue whith pycharm inspection
             query = f"ALTER TABLE assets RENAME COLUMN {column} TO installed_folders;"
             self.run_query(query)
+            self._clear_schema_cache()
             self.db_version = upgrade_from_version = DbVersionNum.V11
         if upgrade_from_version == DbVersionNum.V11:
             self._add_missing_columns('assets', required_columns={'release_info': 'TEXT'})
@@ -661,7 +680,20 @@ class UEAssetDbHandler:
         :param where_clause: string containing the WHERE clause to use in the SQL query.
         :return: list(rows).
         """
+        rows, _ = self.get_assets_data_and_columns_for_csv(where_clause=where_clause)
+        return rows
+
+    def get_assets_data_and_columns_for_csv(self, where_clause='') -> (list, list):
+        """
+        Get data from all the assets in the 'assets' table for a "CSV file" like format, and their column names.
+        :param where_clause: string containing the WHERE clause to use in the SQL query.
+        :return: (list(rows), list(column_names)).
+
+        Notes:
+            The column names are the same as the ones returned by get_columns_name_for_csv(), but without running another query.
+        """
         rows = []
+        csv_column_names = []
         if self.connection is not None:
             cursor = self.connection.cursor()
             # generate column names for the CSV file using AS to rename the columns
@@ -690,10 +722,12 @@ class UEAssetDbHandler:
             try:
                 cursor.execute(query)
                 rows = cursor.fetchall()
+                # by using the 'AS' in the SQL query, the column names are the CSV column names
+                csv_column_names = [description[0] for description in cursor.description]
                 cursor.close()
             except sqlite3.OperationalError as error:
                 self.logger.warning(f"Error while getting asset's data: {error!r}")
-        return rows
+        return rows, csv_column_names
 
     def get_columns_name_for_csv(self) -> list:
         """
@@ -785,6 +819,17 @@ class UEAssetDbHandler:
             self.connection.commit()
             cursor.close()
 
+    def delete_assets(self, asset_ids: list) -> None:
+        """
+        Delete several assets from the 'assets' table by their asset_id, with a single commit.
+        :param asset_ids: list of the asset_ids of the assets to delete.
+        """
+        if self.connection is not None and asset_ids:
+            cursor = self.connection.cursor()
+            cursor.executemany("DELETE FROM assets WHERE asset_id = ?", [(asset_id, ) for asset_id in asset_ids])
+            self.connection.commit()
+            cursor.close()
+
     def delete_all_assets(self, keep_added_manually=True) -> None:
         """
         Delete all assets from the 'assets' table.
@@ -1032,18 +1077,46 @@ class UEAssetDbHandler:
             cursor.execute("DROP TABLE IF EXISTS assets")
             self.connection.commit()
             cursor.close()
+            self._clear_schema_cache()
 
     def get_table_names(self) -> list:
         """
         Get the names of all the tables in the database.
         :return: list of table names.
+
+        Notes:
+            The result is cached until the tables structure is changed by this class.
         """
         result = []
         if self.connection is not None:
-            cursor = self.connection.cursor()
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
-            result = [name[0] for name in cursor.fetchall()]
-            cursor.close()
+            schema_cache = self._get_schema_cache()
+            if schema_cache['tables'] is None:
+                cursor = self.connection.cursor()
+                cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
+                schema_cache['tables'] = [name[0] for name in cursor.fetchall()]
+                cursor.close()
+            # return a copy because the caller could modify the list
+            result = schema_cache['tables'].copy()
+        return result
+
+    def get_table_columns(self, table_name: str) -> list:
+        """
+        Get the names of the columns of a table.
+        :param table_name: name of the table.
+        :return: list of column names.
+
+        Notes:
+            The result is cached until the tables structure is changed by this class.
+        """
+        result = []
+        if self.connection is not None:
+            columns_cache = self._get_schema_cache()['columns']
+            if table_name not in columns_cache:
+                cursor = self.connection.cursor()
+                cursor.execute(f"PRAGMA table_info({table_name});")
+                columns_cache[table_name] = [column[1] for column in cursor.fetchall()]
+                cursor.close()
+            result = columns_cache[table_name].copy()
         return result
 
     def export_to_csv(
@@ -1089,14 +1162,14 @@ class UEAssetDbHandler:
                     create_file_backup(file_src=file_name, backups_folder=folder_for_csv_files)
                 # Get column names
                 if fields == '*':
-                    cursor.execute(f"PRAGMA table_info({table_name});")
-                    column_names = [column[1] for column in cursor.fetchall()]
+                    column_names = self.get_table_columns(table_name)
                 else:
                     column_names = fields.split(',')
                 query = f"SELECT {fields} FROM {table_name}"
-                rows = cursor.execute(query).fetchall()
+                # the rows are not fetched here, the cursor is given directly to writerows to stream them without building a list
+                rows = cursor.execute(query)
                 try:
-                    with open(file_name_p, 'w', newline='', encoding='utf-8') as file:
+                    with open(file_name_p, 'w', newline='', encoding='utf-8', buffering=1 << 20) as file:
                         writer = csv.writer(file, dialect='unix')
                         # Write column names
                         writer.writerow(column_names)
@@ -1188,8 +1261,7 @@ class UEAssetDbHandler:
                         reader = csv.reader(file, dialect='unix')
                         csv_columns = next(reader)
                         # Get column names from database
-                        cursor.execute(f"PRAGMA table_info({table_name});")
-                        db_columns = [column[1] for column in cursor.fetchall()]
+                        db_columns = self.get_table_columns(table_name)
                         # Check if columns match
                         if not is_partial and csv_columns != db_columns:
                             msg = f'Columns in CSV file "{file_name}" do not match columns in table "{table_name}".'
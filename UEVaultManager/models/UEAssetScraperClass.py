@@ -22,8 +22,8 @@ from UEVaultManager.api.egs import is_asset_obsolete
 from UEVaultManager.core import AppCore
 from UEVaultManager.lfs.utils import path_join
 from UEVaultManager.models.csv_sql_fields import convert_data_to_csv, csv_sql_fields, debug_parsed_data, get_csv_field_name_list, \
-    get_sql_field_name_list, get_sql_preserved_fields, is_on_state, is_preserved
-from UEVaultManager.models.types import CSVFieldState, DateFormat, GetDataResult
+    get_sql_field_name, get_sql_field_name_list, get_sql_preserved_fields, is_preserved
+from UEVaultManager.models.types import DateFormat, GetDataResult
 from UEVaultManager.models.UEAssetClass import UEAsset
 from UEVaultManager.models.UEAssetDbHandlerClass import UEAssetDbHandler
 from UEVaultManager.tkgui.modules.cls.FakeProgressWindowClass import FakeProgressWindow
@@ -31,7 +31,8 @@ from UEVaultManager.tkgui.modules.functions import box_yesno, update_loggers_lev
 from UEVaultManager.tkgui.modules.functions_no_deps import check_and_convert_list_to_str
 from UEVaultManager.tkgui.modules.types import DataSourceType
 from UEVaultManager.tkgui.modules.types import GrabResult
-from UEVaultManager.utils.cli import str_is_bool, str_to_bool
+from UEVaultManager.utils.cli import try_str_to_bool
+from UEVaultManager.utils.json_fast import json_dumps, json_loads
 
 
 # noinspection PyPep8Naming
@@ -258,6 +259,16 @@ class UEAssetScraper:
             else:
                 self.logger.error(message)
 
+    def _is_debug_logged(self) -> bool:
+        """
+        Check if a message logged with the 'debug' level by _log() would be displayed.
+        Use it before building a debug message in a loop, to avoid formatting a message that will be ignored.
+        :return: True if the debug messages are displayed.
+        """
+        if gui_g.UEVM_cli_ref is None and self.debug_mode:
+            return True
+        return gui_g.s.testing_switch >= 1 or self.logger.isEnabledFor(logging.DEBUG)
+
     def _log_for_task(self, message: str):
         """ a simple wrapper for a scraptask. It allows to set the level that could not be passed as parameter"""
         self._log(message, level='debug')
@@ -285,6 +296,8 @@ class UEAssetScraper:
 
         asset_db_handler = self.asset_db_handler
         use_database = self.use_database and asset_db_handler
+        # all the assets parsed in the same call share the same update date
+        date_now = datetime.now().strftime(DateFormat.csv)
         for one_asset_json_data_from_egs_ori in assets_json_data_from_egs:
             # !! ALL DATA HERE ARE STORED IN are already in json format. no need to decode them !!
             # WARNING: asset_data_ori WILL ALSO BE MODIFIED OUTSIDE the method and changed WILL BE SAVED in the json files
@@ -323,7 +336,6 @@ class UEAssetScraper:
                 # add the app_name to the asset_data, and it will be saved in the json file
                 one_asset_json_data_from_egs_ori['app_name'] = app_name
                 origin = gui_g.s.origin_marketplace  # by default when scraped from marketplace
-                date_now = datetime.now().strftime(DateFormat.csv)
                 grab_result = GrabResult.NO_ERROR.name
 
                 # make some calculation with the "raw" data
@@ -544,8 +556,9 @@ class UEAssetScraper:
                 # keep only fields that are in "valid" (filter all unused fields from the json file)
                 cleaned_data = {key: data.get(key, '') for key in get_sql_field_name_list(include_asset_only=True)}
                 returned_assets_json_data_parsed.append(cleaned_data)
-                message = f'Asset with uid={uid} added to content: owned={ue_asset.get("owned")} creation_date={ue_asset.get("creation_date")}'
-                self._log(message, 'debug')  # use debug here instead of info to avoid spamming the log file
+                if self._is_debug_logged():
+                    message = f'Asset with uid={uid} added to content: owned={ue_asset.get("owned")} creation_date={ue_asset.get("creation_date")}'
+                    self._log(message, 'debug')  # use debug here instead of info to avoid spamming the log file
                 if self.store_ids:
                     try:
                         self._scraped_ids.append(uid)
@@ -574,113 +587,105 @@ class UEAssetScraper:
         self.asset_db_handler.save_last_run(last_run_content)
         return is_ok
 
-    def _update_and_merge_csv_record_data(self, _asset_id: str, _csv_field_name_list: [], _csv_record: [], _assets_in_file) -> list:
+    def _update_and_merge_csv_record_data(self, _asset_id: str, _merge_columns: list, _csv_record: [], _row_in_file: list) -> list:
         """
-        Updates the data of the asset with the data from the items in the file.
+        Updates the data of the asset with the data from the row in the file.
         :param _asset_id: id of the asset to update.
-        :param _csv_field_name_list: list of the CSV field names.
-        :param _csv_record: LIST of data of the asset to update. Must be sorted in the same order as csv_field_name_list.
-        :param _assets_in_file: list of items in the file.
+        :param _merge_columns: list of (index in the record, CSV field name, is preserved, index in the file) tuples for the columns to merge.
+                Only the preserved columns and the 'Price' and 'Origin' columns need to be merged. The index in the file is None if the column is not in the file.
+        :param _csv_record: LIST of data of the asset to update. Must be sorted in the same order as csv_field_name_list. It's updated in place.
+        :param _row_in_file: LIST of data of the same asset read in the existing file.
         :return: list of values to be written in the CSV file.
         """
-        # merge data from the items in the file (if exists) and those get by the application
-        # items_in_file must be a dict of dicts
-        file_fields_count = len(_csv_field_name_list)
-        if _assets_in_file.get(_asset_id):
-            item_in_file = _assets_in_file.get(_asset_id)
-            keys_check = item_in_file.keys()
-            if gui_g.s.index_copy_col_name in keys_check:
-                file_fields_count += 1
-            if len(keys_check) != file_fields_count:
-                self._log(
-                    f'In the existing file, asset {_asset_id} has not the same number of keys as the CSV headings. This asset is ignored and its values will be overwritten',
-                    'error'
-                )
-                return _csv_record
-            else:
-                # loops through its columns to UPDATE the data with EXISTING VALUE if its state is PRESERVED
-                # !! no data cleaning must be done here !!!!
-                price_index = 0
-                _price = float(gui_g.no_float_data)
-                old_price = float(gui_g.no_float_data)
-                for index, _csv_field in enumerate(_csv_field_name_list):
-                    preserved_value_in_file = is_preserved(csv_field_name=_csv_field)
-                    value = item_in_file.get(_csv_field, None)
-                    if value is None:
-                        self._log(f'In the existing data, asset {_asset_id} has no column named {_csv_field}.', level='warning')
-                        continue
-                    # get rid of 'None' values in CSV file
-                    if value in gui_g.s.cell_is_nan_list:
-                        _csv_record[index] = ''
-                        continue
-                    value = str(value)
-                    # Get the old price in the previous file
-                    if _csv_field == 'Price':
-                        price_index = index
-                        _price = gui_fn.convert_to_float(_csv_record[price_index])
-                        old_price = gui_fn.convert_to_float(
-                            item_in_file[_csv_field]
-                        )  # Note: 'old price' is the 'price' saved in the file, not the 'old_price' in the file
-                    elif _csv_field == 'Origin':
-                        # all the folders when the asset came from are stored in a comma separated list
-                        if isinstance(value, str):
-                            folder_list = value.split(',')
-                        else:
-                            folder_list = value if value else []
-                        # add the new folder to the list without duplicates
-                        if _csv_record[index] not in folder_list:
-                            folder_list.append(_csv_record[index])
-                        # update the list in the CSV record
-                        _csv_record[index] = ','.join(folder_list)  # keep join() here to raise an error if installed_folders is not a list of strings
-
-                    if preserved_value_in_file:
-                        _csv_record[index] = str_to_bool(value) if str_is_bool(value) else value
-                # end for key, state in csv_sql_fields.items()
-                if price_index > 0:
-                    _csv_record[price_index + 1] = old_price
-            # end ELSE if len(item_in_file.keys()) != file_fields_count
-        # end if _assets_in_file.get(_asset_id)
-        # print(f'debug here')
+        # merge data from the row in the file and those get by the application
+        row_length = len(_row_in_file)
+        # loops through its columns to UPDATE the data with EXISTING VALUE if its state is PRESERVED
+        # !! no data cleaning must be done here !!!!
+        price_index = 0
+        _price = float(gui_g.no_float_data)
+        old_price = float(gui_g.no_float_data)
+        for index, _csv_field, preserved_value_in_file, file_index in _merge_columns:
+            value = _row_in_file[file_index] if file_index is not None and file_index < row_length else None
+            if value is None:
+                self._log(f'In the existing data, asset {_asset_id} has no column named {_csv_field}.', level='warning')
+                continue
+            # get rid of 'None' values in CSV file
+            if value in gui_g.s.cell_is_nan_list:
+                _csv_record[index] = ''
+                continue
+            value = str(value)
+            # Get the old price in the previous file
+            if _csv_field == 'Price':
+                price_index = index
+                _price = gui_fn.convert_to_float(_csv_record[price_index])
+                old_price = gui_fn.convert_to_float(
+                    _row_in_file[file_index]
+                )  # Note: 'old price' is the 'price' saved in the file, not the 'old_price' in the file
+            elif _csv_field == 'Origin':
+                # all the folders when the asset came from are stored in a comma separated list
+                # a dict is used as an ordered set, to add the new folder to the list without duplicates
+                folders = dict.fromkeys(value.split(','))
+                folders[_csv_record[index]] = None
+                # update the list in the CSV record
+                _csv_record[index] = ','.join(folders)  # keep join() here to raise an error if installed_folders is not a list of strings
+
+            if preserved_value_in_file:
+                _, _csv_record[index] = try_str_to_bool(value)
+        # end for key, state in csv_sql_fields.items()
+        if price_index > 0:
+            _csv_record[price_index + 1] = old_price
         return _csv_record
 
         # end self._update_and_merge_csv_record_data
 
-    def _update_and_merge_json_record_data(self, _asset, _assets_in_file, _no_float_value: float, _no_bool_false_value: bool) -> dict:
+    def _update_and_merge_json_record_data(self, _asset_id: str, _preserved_fields: list, _json_record: dict, _item_in_file: dict) -> dict:
         """
-        Updates the data of the asset with the data from the items in the file.
-        :param _asset: asset to update.
-        :param _assets_in_file: list of assets in the file.
-        :param _no_float_value:  value to use when no float data is available.
-        :param _no_bool_false_value: value (False) to use when no bool data is available.
+        Updates the data of the asset with the data from the item in the file.
+        :param _asset_id: id of the asset to update.
+        :param _preserved_fields: list of the csv fields whose value is kept from the file.
+        :param _json_record: dict of data of the asset to update. It's updated in place.
+        :param _item_in_file: dict of data of the same asset read in the existing file.
         :return: dict of data of the asset to update.
         """
-        _asset_id = _asset[0]
-        _json_record = _asset[1]
-
-        # merge data from the items in the file (if exists) and those get by the application
-        # items_in_file is a dict of dict
-        if _assets_in_file.get(_asset_id):
-            # loops through its columns
-            _price = float(_no_float_value)
-            old_price = float(_no_float_value)
-            for field, state in csv_sql_fields.items():
-                preserved_value_in_file = is_preserved(csv_field_name=field)
-                if preserved_value_in_file and _assets_in_file[_asset_id].get(field):
-                    _json_record[field] = _assets_in_file[_asset_id][field]
+        # merge data from the item in the file and those get by the application
+        old_price = float(gui_g.no_float_data)
+        for field in _preserved_fields:
+            if _item_in_file.get(field):
+                _json_record[field] = _item_in_file[field]
 
-            # Get the old price in the previous file
-            try:
-                _price = float(_json_record['Price'])
-                old_price = float(
-                    _assets_in_file[_asset_id]['Price']
-                )  # Note: 'old price' is the 'price' saved in the file, not the 'old_price' in the file
-            except Exception as _error:
-                self._log(f'Old price values can not be converted for asset {_asset_id}\nError:{_error!r}', level='warning')
-            _json_record['Old price'] = old_price
+        # Get the old price in the previous file
+        try:
+            old_price = float(_item_in_file['Price'])  # Note: 'old price' is the 'price' saved in the file, not the 'old_price' in the file
+        except Exception as _error:
+            self._log(f'Old price values can not be converted for asset {_asset_id}\nError:{_error!r}', level='warning')
+        _json_record['Old price'] = old_price
         return _json_record
 
     # end def update_and_merge_json_record_data
 
+    def _get_csv_field_name_list_for_file(self) -> list:
+        """
+        Get the list of the csv fields to write in a file, sorted in the same order as the columns of the datatable.
+        :return: list of the csv field names.
+        """
+        csv_field_name_list = get_csv_field_name_list()
+        columns_infos = gui_g.s.get_column_infos(DataSourceType.FILE)
+        sorted_cols_by_pos = dict(sorted(columns_infos.items(), key=lambda item: item[1]['pos']))
+        new_csv_field_name_list = []
+        # add the csv fields in the same order as in the columns_infos
+        for col_name in sorted_cols_by_pos:
+            if col_name in csv_field_name_list:
+                new_csv_field_name_list.append(col_name)
+        # add the csv fields that could be missing in the columns_infos
+        for col_name in csv_field_name_list:
+            if col_name not in csv_field_name_list:
+                new_csv_field_name_list.append(col_name)
+
+        # remove the "index copy" field from the list
+        if gui_g.s.index_copy_col_name in new_csv_field_name_list:
+            new_csv_field_name_list.remove(gui_g.s.index_copy_col_name)
+        return new_csv_field_name_list
+
     def _save_final_in_file(self, filename: str = '', save_to_format: str = 'csv') -> bool:
         """
         Save the scraped data into a file.
@@ -690,114 +695,160 @@ class UEAssetScraper:
         """
         assets_to_output = {}
         asset_count = 0
-        assets_in_file = {}
-        output = None
+        is_csv = save_to_format == 'tcsv' or save_to_format == 'csv'
+        has_existing_file = os.path.isfile(filename) and os.path.getsize(filename) > 0
+        if is_csv:
+            # the csv records are built directly from the scraped data, with values sorted by the csv field name
+            # the sql field names are get only once, they are used for all the assets
+            new_csv_field_name_list = self._get_csv_field_name_list_for_file()
+            sql_field_name_list = [get_sql_field_name(csv_field) for csv_field in new_csv_field_name_list]
+        else:
+            # get the csv fields name only once, it's used for all the assets. A set is used for a fast lookup
+            csv_field_name_list = frozenset(get_csv_field_name_list())
         self.progress_window.reset(new_value=0, new_text="Converting data to csv...It could take some time", new_max_value=len(self._scraped_data))
-        for asset_data in self._scraped_data:
-            if not self.progress_window.update_and_continue(increment=1):
+        for index, asset_data in enumerate(self._scraped_data):
+            # the progress window is only updated every 64 assets, updating it for each asset takes longer than the conversion itself
+            if index & 0x3F == 0 and not self.progress_window.update_and_continue(value=index):
                 return False
             asset_id = asset_data['asset_id']
-            assets_to_output[asset_id] = convert_data_to_csv(sql_asset_data=asset_data)
+            if is_csv:
+                csv_record = []
+                for sql_field in sql_field_name_list:
+                    value = asset_data.get(sql_field, None)
+                    csv_record.append(gui_g.no_text_data if value is None else value)
+                assets_to_output[asset_id] = csv_record
+            else:
+                assets_to_output[asset_id] = convert_data_to_csv(sql_asset_data=asset_data, csv_field_names=csv_field_name_list)
 
-        if save_to_format == 'tcsv' or save_to_format == 'csv':
+        if is_csv:
             # If the output file exists, we read its content to keep some data
+            # each row is merged into the matching csv record as soon as it's read, so the file content is never stored in memory
+            # if the file does not exist or is empty (ex: a new output file), there is nothing to merge and the file is not read
+            if has_existing_file:
+                try:
+                    with open(filename, 'r', encoding='utf-8', newline='', buffering=1 << 20) as input_file:
+                        reader = csv.reader(input_file)
+                        # the columns are accessed by position, so no dict is created for each row of the file
+                        header = next(reader)
+                        file_columns = {col_name: index for index, col_name in enumerate(header)}
+                        asset_id_index = file_columns['Asset_id']
+                        # only the preserved columns and the ones with a specific merge (price and origin) are visited when merging
+                        merge_columns = []
+                        for index, csv_field in enumerate(new_csv_field_name_list):
+                            preserved_value_in_file = is_preserved(csv_field_name=csv_field)
+                            if preserved_value_in_file or csv_field in ('Price', 'Origin'):
+                                merge_columns.append((index, csv_field, preserved_value_in_file, file_columns.get(csv_field, None)))
+                        # the 'urlSlug' column is a duplicate field that is ignored
+                        file_fields_count = len(file_columns) - (1 if 'urlSlug' in file_columns else 0)
+                        expected_fields_count = len(new_csv_field_name_list) + (1 if gui_g.s.index_copy_col_name in file_columns else 0)
+                        has_same_fields_count = file_fields_count == expected_fields_count
+                        header_length = len(header)
+                        for row_in_file in reader:
+                            if len(row_in_file) <= asset_id_index:
+                                continue
+                            asset_id = row_in_file[asset_id_index]
+                            csv_record = assets_to_output.get(asset_id)
+                            if csv_record is None:
+                                continue
+                            if not has_same_fields_count or len(row_in_file) > header_length:
+                                self._log(
+                                    f'In the existing file, asset {asset_id} has not the same number of keys as the CSV headings. This asset is ignored and its values will be overwritten',
+                                    'error'
+                                )
+                                continue
+                            self._update_and_merge_csv_record_data(
+                                _asset_id=asset_id, _merge_columns=merge_columns, _csv_record=csv_record, _row_in_file=row_in_file
+                            )
+                except (FileExistsError, OSError, UnicodeDecodeError, StopIteration):
+                    self._log(f'Could not read CSV record from the file {filename}', level='warning')
+
+            # write into a temporary file and replace the existing one at the end, to never leave a partially written file
+            temp_filename = filename + '.tmp'
+            self.progress_window.reset(new_value=0, new_text="Writing assets into csv file...", new_max_value=len(assets_to_output))
+            is_cancelled = False
+
+            def _records_to_write():
+                """
+                Yield the csv records to write and update the progress window every 64 records.
+                """
+                nonlocal asset_count, is_cancelled
+                for index, _csv_record in enumerate(assets_to_output.values()):
+                    if index & 0x3F == 0 and not self.progress_window.update_and_continue(value=index):
+                        is_cancelled = True
+                        return
+                    asset_count += 1
+                    yield _csv_record
+
             try:
-                with open(filename, 'r', encoding='utf-8') as output:
-                    csv_file_content = csv.DictReader(output)
-                    # get the data (it's a dict)
-                    for csv_record in csv_file_content:
-                        # noinspection PyTypeChecker
-                        csv_record = dict(csv_record)
-                        if 'urlSlug' in csv_record:
-                            del (csv_record['urlSlug'])  # we remove the duplicate field to avoid future mistakes
-                        asset_id = csv_record['Asset_id']
-                        assets_in_file[asset_id] = csv_record
-                    output.close()
-            except (FileExistsError, OSError, UnicodeDecodeError, StopIteration):
-                self._log(f'Could not read CSV record from the file {filename}', level='warning')
-            # reopen file for writing
-            output = open(filename, 'w', encoding='utf-8')
-            writer = csv.writer(output, dialect='excel-tab' if save_to_format == 'tcsv' else 'excel', lineterminator='\n')
-
-            # get final the csv fields name list by
-            csv_field_name_list = get_csv_field_name_list()
-            columns_infos = gui_g.s.get_column_infos(DataSourceType.FILE)
-            sorted_cols_by_pos = dict(sorted(columns_infos.items(), key=lambda item: item[1]['pos']))
-            new_csv_field_name_list = []
-            # add the csv fields in the same order as in the columns_infos
-            for col_name in sorted_cols_by_pos:
-                if col_name in csv_field_name_list:
-                    new_csv_field_name_list.append(col_name)
-            # add the csv fields that could be missing in the columns_infos
-            for col_name in csv_field_name_list:
-                if col_name not in csv_field_name_list:
-                    new_csv_field_name_list.append(col_name)
-
-            # remove the "index copy" field from the list
-            if gui_g.s.index_copy_col_name in new_csv_field_name_list:
-                new_csv_field_name_list.remove(gui_g.s.index_copy_col_name)
-
-            writer.writerow(new_csv_field_name_list)
-            self.progress_window.reset(new_value=0, new_text="Writing assets into csv file...", new_max_value=len(assets_to_output.items()))
-            for asset_id, asset_data in assets_to_output.items():
-                if not self.progress_window.update_and_continue(increment=1):
-                    return False
-                for key in asset_data.keys():
-                    # clean the asset data by removing the columns that are not in the csv field name list
-                    ignore_in_csv = is_on_state(csv_field_name=key, states=[CSVFieldState.ASSET_ONLY], default=False)
-                    if ignore_in_csv:
-                        self._log(f'{key} must be ignored in CSV. Removing it from the asset data', 'debug')
-                        del (asset_data[key])
-
-                csv_record = []  # values must be sorted by the csv field name
-                for csv_field in new_csv_field_name_list:
-                    csv_record.append(asset_data.get(csv_field, gui_g.no_text_data))
-
-                if len(assets_in_file) > 0:
-                    csv_record_merged = self._update_and_merge_csv_record_data(
-                        _asset_id=asset_data['Asset_id'],
-                        _csv_field_name_list=new_csv_field_name_list,
-                        _csv_record=csv_record,
-                        _assets_in_file=assets_in_file
-                    )
-                else:
-                    csv_record_merged = csv_record
-                asset_count += 1
-                writer.writerow(csv_record_merged)
+                with open(temp_filename, 'w', encoding='utf-8', newline='', buffering=1 << 20) as output:
+                    writer = csv.writer(output, dialect='excel-tab' if save_to_format == 'tcsv' else 'excel', lineterminator='\n')
+                    writer.writerow(new_csv_field_name_list)
+                    # all the records are written with a single call to benefit from the C implementation of the csv writer
+                    writer.writerows(_records_to_write())
+            except BaseException:
+                # the temporary file must not be left when the writing fails
+                if os.path.isfile(temp_filename):
+                    os.remove(temp_filename)
+                raise
+            if is_cancelled:
+                os.remove(temp_filename)
+                return False
+            # the progress window is only updated every 64 records while writing
+            self.progress_window.update_and_continue(value=len(assets_to_output))
+            os.replace(temp_filename, filename)
 
         elif save_to_format == 'json':
             # TODO: test the json result file
             # If the output file exists, we read its content to keep some data
-            try:
-                with open(filename, 'r', encoding='utf-8') as output:
-                    assets_in_file = json.load(output)
-            except (FileExistsError, OSError, UnicodeDecodeError, StopIteration, json.decoder.JSONDecodeError):
-                self._log(f'Could not read Json record from the file {filename}', level='warning')
-            # reopen file for writing
-            output = open(filename, 'w', encoding='utf-8')
-            json_content = {}
-            self.progress_window.reset(new_value=0, new_text="Writing assets into json file...", new_max_value=len(assets_to_output.items()))
-            for asset_id, asset_data in assets_to_output:
-                if not self.progress_window.update_and_continue(increment=1):
-                    return False
-                if len(assets_in_file) > 0:
-                    json_record_merged = self._update_and_merge_json_record_data(
-                        asset_data, assets_in_file, gui_g.no_float_data, gui_g.no_bool_false_data
-                    )
-                else:
-                    json_record_merged = asset_data
+            assets_in_file = {}
+            if has_existing_file:
                 try:
-                    asset_id = json_record_merged['Asset_id']
-                    json_content[asset_id] = json_record_merged
-                    asset_count += 1
-                except (OSError, UnicodeEncodeError, TypeError) as error:
-                    message = f'Could not write Json record for {asset_id} into {filename}\nError:{error!r}'
-                    self._log(message, level='error')
-            json.dump(json_content, output, indent=2)
-
-        # close the opened file
-        if output is not None:
-            output.close()
+                    with open(filename, 'rb') as input_file:
+                        assets_in_file = json_loads(input_file.read())
+                except (FileExistsError, OSError, UnicodeDecodeError, StopIteration, json.decoder.JSONDecodeError):
+                    self._log(f'Could not read Json record from the file {filename}', level='warning')
+            # the preserved fields are the same for all the assets, so they are get only once
+            preserved_fields = [field for field in csv_sql_fields.keys() if is_preserved(csv_field_name=field)]
+            # the records are written one by one, so the whole json content is never built in memory
+            # write into a temporary file and replace the existing one at the end, to never leave a partially written file
+            temp_filename = filename + '.tmp'
+            self.progress_window.reset(new_value=0, new_text="Writing assets into json file...", new_max_value=len(assets_to_output))
+            is_cancelled = False
+            try:
+                with open(temp_filename, 'w', encoding='utf-8', buffering=1 << 20) as output:
+                    output.write('{')
+                    separator = '\n'
+                    for index, (asset_id, asset_data) in enumerate(assets_to_output.items()):
+                        if index & 0x3F == 0 and not self.progress_window.update_and_continue(value=index):
+                            is_cancelled = True
+                            break
+                        item_in_file = assets_in_file.get(asset_id)
+                        if item_in_file:
+                            json_record_merged = self._update_and_merge_json_record_data(asset_id, preserved_fields, asset_data, item_in_file)
+                        else:
+                            json_record_merged = asset_data
+                        try:
+                            asset_id = json_record_merged['Asset_id']
+                            # the record is indented to get the same result as a json.dump() of the whole content with indent=2
+                            json_record = json_dumps(json_record_merged, indent=True).replace('\n', '\n  ')
+                            output.write(f'{separator}  {json_dumps(asset_id)}: {json_record}')
+                            separator = ',\n'
+                            asset_count += 1
+                        except (OSError, UnicodeEncodeError, TypeError) as error:
+                            message = f'Could not write Json record for {asset_id} into {filename}\nError:{error!r}'
+                            self._log(message, level='error')
+                    output.write('}' if asset_count == 0 else '\n}')
+            except BaseException:
+                # the temporary file must not be left when the writing fails
+                if os.path.isfile(temp_filename):
+                    os.remove(temp_filename)
+                raise
+            if is_cancelled:
+                os.remove(temp_filename)
+                return False
+            self.progress_window.update_and_continue(value=len(assets_to_output))
+            os.replace(temp_filename, filename)
+
         self._log(f'\n======\n{asset_count} assets have been saved (without duplicates due to different UE versions)\nOperation Finished\n======\n')
         return True
 
@@ -1061,9 +1112,9 @@ class UEAssetScraper:
         for filename in files:
             if filename.endswith('.json') and filename != self._last_run_filename:
                 # self._log(f'Loading {filename}','debug')
-                with open(path_join(folder, filename), 'r', encoding='utf-8') as file:
+                with open(path_join(folder, filename), 'rb') as file:
                     try:
-                        json_data_from_egs_file = json.load(file)
+                        json_data_from_egs_file = json_loads(file.read())
                     except json.decoder.JSONDecodeError as error:
                         self._log(f'The following error occured when loading data from {filename}:{error!r}', 'warning')
                         continue
@@ -3,6 +3,7 @@
 CSV and SQL fields mapping and utility functions.
 """
 from datetime import datetime
+from functools import lru_cache
 
 from pandas import CategoricalDtype
 
@@ -353,6 +354,30 @@ def get_typed_value(csv_field='', sql_field='', value='') -> (any, ):
     return value
 
 
+@lru_cache(maxsize=None)
+def _get_csv_field_names_on_states(states: tuple) -> frozenset:
+    """
+    Get the csv field names that are in the given states.
+    :param states: tuple of states to check.
+    :return: set of the csv field names in the given states.
+
+    Notes:
+        The fields definition never changes at runtime, so the result is computed only once for each states tuple.
+    """
+    return frozenset(csv_field for csv_field, field_data in csv_sql_fields.items() if field_data['state'] in states)
+
+
+def get_csv_field_names_on_states(states: list[CSVFieldState]) -> frozenset:
+    """
+    Get the csv field names that are in the given states.
+    :param states: list of states to check.
+    :return: set of the csv field names in the given states.
+    """
+    if not isinstance(states, list):
+        states = [states]
+    return _get_csv_field_names_on_states(tuple(states))
+
+
 def is_on_state(csv_field_name: str, states: list[CSVFieldState], default=False) -> bool:
     """
     Check if the csv field is in the given states.
@@ -361,14 +386,10 @@ def is_on_state(csv_field_name: str, states: list[CSVFieldState], default=False)
     :param default: default value if the field is not in the list.
     :return: True if is in the given states.
     """
-    if not isinstance(states, list):
-        states = [states]
-    try:
-        state = get_state(csv_field_name)
-        return state in states
-    except KeyError:
+    if csv_field_name not in csv_sql_fields:
         # print(f'Key not found {csv_field_name} in is_on_state()')  # debug only. Will flood the console
         return default  # by default, we consider that the field is not on this state
+    return csv_field_name in get_csv_field_names_on_states(states)
 
 
 def is_from_type(csv_field_name: str, types: list[CSVFieldType], default=False) -> bool:
@@ -443,6 +464,9 @@ def get_default_value(csv_field_name: str = '', sql_field_name: str = ''):
     if sql_field_name and not csv_field_name:
         csv_field_name = get_csv_field_name(sql_field_name)
     field_type = get_field_type(csv_field_name)
+    if field_type == CSVFieldType.DATETIME:
+        # only get the current date when it's needed
+        return datetime.now().strftime(DateFormat.csv)
     default_values = {
         # CSVFieldType.LIST: [],
         # CSVFieldType.STR: '',
@@ -450,7 +474,6 @@ def get_default_value(csv_field_name: str = '', sql_field_name: str = ''):
         CSVFieldType.INT: 0,
         CSVFieldType.FLOAT: 0.0,
         CSVFieldType.BOOL: False,
-        CSVFieldType.DATETIME: datetime.now().strftime(DateFormat.csv),
     }
     return default_values.get(field_type, 'None')
 
@@ -500,18 +523,28 @@ def get_label_for_field(csv_field_name: str):
         return csv_field_name.replace('_', ' ').title()
 
 
+@lru_cache(maxsize=None)
+def _get_sql_to_csv_field_mapping() -> dict:
+    """
+    Get the mapping between the sql field names and the csv field names.
+    :return: dict with the sql field names as keys and the csv field names as values.
+
+    Notes:
+        When several csv fields use the same sql field, the first one is kept.
+    """
+    result = {}
+    for csv_field, field_data in csv_sql_fields.items():
+        result.setdefault(field_data['sql_name'], csv_field)
+    return result
+
+
 def get_csv_field_name(sql_field_name: str) -> str:
     """
     Get the csv field name for a sql field name.
     :param sql_field_name: sql field name.
     :return: csv field name.
     """
-    result = None
-    for key, value in csv_sql_fields.items():
-        if value['sql_name'] == sql_field_name:
-            result = key
-            break
-    return result
+    return _get_sql_to_csv_field_mapping().get(sql_field_name, None)
 
 
 def get_sql_user_fields() -> list:
@@ -584,18 +617,26 @@ def create_empty_csv_row(return_as_string=False):
     return data
 
 
+@lru_cache(maxsize=None)
+def get_csv_to_sql_field_mapping() -> dict:
+    """
+    Get the mapping between the csv field names and the sql field names.
+    :return: dict with the csv field names as keys and the sql field names as values.
+
+    Notes:
+        The result is cached and shared, it must not be modified.
+    """
+    return {csv_field: field_data['sql_name'] for csv_field, field_data in csv_sql_fields.items() if field_data['sql_name']}
+
+
 def convert_csv_row_to_sql_row(csv_row: dict) -> dict:
     """
     Convert a csv row to a sql row.
     :param csv_row: csv row.
     :return: sql row.
     """
-    sql_row = {}
-    for csv_field, value in csv_row.items():
-        sql_field = get_sql_field_name(csv_field)
-        if sql_field:
-            sql_row[sql_field] = value
-    return sql_row
+    csv_to_sql = get_csv_to_sql_field_mapping()
+    return {csv_to_sql[csv_field]: value for csv_field, value in csv_row.items() if csv_field in csv_to_sql}
 
 
 def debug_parsed_data(asset_data: dict, mode: DataSourceType) -> None:
@@ -668,15 +709,25 @@ def debug_parsed_data(asset_data: dict, mode: DataSourceType) -> None:
         debug_func(key_csv_not_in_asset)
 
 
-def convert_data_to_csv(sql_asset_data: dict) -> dict:
+def convert_data_to_csv(sql_asset_data: dict, csv_field_names=None) -> dict:
     """
     Return the asset data as a dictionary with the csv field names.
     :param sql_asset_data: asset data with keys in sql format.
+    :param csv_field_names: list or set of the csv field names to keep. If None, get_csv_field_name_list() will be used.
+            Should be given (preferably as a set) when converting several assets in a loop.
     :return: asset data with keys in csv format.
+
+    Notes:
+        The fields to drop are filtered out when building the new dict, the source data are never modified.
     """
     # return asset_data to record by converting the "sql" field names to "csv" field names
-    csv_field_names = get_csv_field_name_list()
-    asset_data = {
-        get_csv_field_name(key): value for key, value in sql_asset_data.items() if get_csv_field_name(key) in csv_field_names and value is not None
-    }
+    if csv_field_names is None:
+        csv_field_names = set(get_csv_field_name_list())
+    asset_data = {}
+    for key, value in sql_asset_data.items():
+        if value is None:
+            continue
+        csv_field_name = get_csv_field_name(key)
+        if csv_field_name in csv_field_names:
+            asset_data[csv_field_name] = value
     return asset_data
@@ -64,7 +64,7 @@ class DbToolWindowClass(tk.Toplevel):
         self.must_reload: bool = False
         self.folder_for_csv_files: str = os.path.normpath(folder_for_csv_files) if folder_for_csv_files else ''
         self.db_path: str = os.path.normpath(db_path) if db_path else ''
-        self.db_handler = UEAssetDbHandler(database_name=self.db_path)
+        self._db_handler = None  # created when used, see the db_handler property
         self.frm_control = self.ControlFrame(self)
         self.frm_control.pack(ipadx=0, ipady=0, padx=0, pady=0)
         gui_g.WindowsRef.tool = self
@@ -74,6 +74,19 @@ class DbToolWindowClass(tk.Toplevel):
         self._log(f'Destruction of {self.__class__.__name__} object')
         gui_g.WindowsRef.tool = None
 
+    @property
+    def db_handler(self) -> UEAssetDbHandler:
+        """
+        Return the database handler. If not created, create it.
+        :return: database handler.
+
+        Notes:
+            Creating the handler opens the database and checks its tables, so it's only done when the user starts an action.
+        """
+        if self._db_handler is None:
+            self._db_handler = UEAssetDbHandler(database_name=self.db_path)
+        return self._db_handler
+
     @staticmethod
     def _log(message):
         """ a simple wrapper to use when cli is not initialized"""
@@ -102,9 +115,8 @@ class DbToolWindowClass(tk.Toplevel):
             )
             self.lbl_goal.pack(pady=5)
 
-            var_table_names = container.db_handler.get_table_names()
-            var_table_names.insert(0, container.value_for_all)
-            self.cb_table = ttk.Combobox(self, values=var_table_names, state='readonly')
+            # the table names are read from the database when the list is opened for the first time
+            self.cb_table = ttk.Combobox(self, values=(container.value_for_all, ), state='readonly', postcommand=self.fill_table_names)
             self.cb_table.pack(fill=tk.X, padx=10, pady=1)
             self.var_backup_on_export = tk.BooleanVar(value=True)
             self.ck_backup_on_export = tk.Checkbutton(self, text='Backup exiting files when exporting', variable=self.var_backup_on_export)
@@ -144,6 +156,14 @@ class DbToolWindowClass(tk.Toplevel):
             self.lbl_status = tk.Label(self, text='', fg='green')
             self.lbl_status.pack(padx=5, pady=5)
 
+        def fill_table_names(self) -> None:
+            """
+            Fill the list of the table names, only once.
+            """
+            if len(self.cb_table['values']) > 1:
+                return
+            self.cb_table['values'] = (self.container.value_for_all, *self.container.db_handler.get_table_names())
+
         def copy_to_clipboard(self, _event):
             """
             Copy text to the clipboard.
@@ -165,6 +185,16 @@ class DbToolWindowClass(tk.Toplevel):
             self.text_result.insert('end', text + '\n')
             self.text_result.see('end')
 
+        def add_results(self, lines: list) -> None:
+            """
+            Add several lines of text to the result label, with a single insert.
+            :param lines: lines of text to add.
+            """
+            if not lines:
+                return
+            self.text_result.insert('end', '\n'.join(lines) + '\n')
+            self.text_result.see('end')
+
         def set_status(self, text: str) -> None:
             """
             Set the status label.
@@ -173,6 +203,17 @@ class DbToolWindowClass(tk.Toplevel):
             self.lbl_status.config(text=text)
             self.update()
 
+        def begin_phase(self, text: str) -> None:
+            """
+            Display the text of a starting phase in the status and result labels, and refresh the window once before the processing starts.
+            :param text: text to display.
+            """
+            self.lbl_status.config(text=text)
+            self.text_result.insert('end', text + '\n')
+            self.text_result.see('end')
+            # the processing that follows blocks the event loop, so only the display is refreshed
+            self.update_idletasks()
+
         def close_window(self) -> None:
             """
             Close the window.
@@ -187,8 +228,7 @@ class DbToolWindowClass(tk.Toplevel):
                 messagebox.showinfo('Info', 'Processing is already running.')
                 return
             self.processing = True
-            self.add_result('Processing...', set_status=True)
-            self.update()
+            self.begin_phase('Processing...')
             delete_content = self.var_delete_content.get()
             table_name = self.cb_table.get()
             if table_name == self.container.value_for_all:
@@ -218,9 +258,7 @@ class DbToolWindowClass(tk.Toplevel):
                 self.container._log(message)
                 self.processing = False
                 return
-            self.add_result('Data imported from files:')
-            for file in files:
-                self.add_result(file)
+            self.add_results(['Data imported from files:'] + files)
             self.add_result('Import finished.', set_status=True)
             self.container.must_reload = must_reload
             self.processing = False
@@ -233,8 +271,7 @@ class DbToolWindowClass(tk.Toplevel):
                 messagebox.showinfo('Info', 'Processing is already running.')
                 return
             self.processing = True
-            self.add_result('Processing...', set_status=True)
-            self.update()
+            self.begin_phase('Processing...')
             table_name = self.cb_table.get()
             if table_name == self.container.value_for_all:
                 table_name = ''
@@ -251,9 +288,7 @@ class DbToolWindowClass(tk.Toplevel):
                     suffix=self.container._user_fields_suffix
                 )
 
-            self.add_result('Data exported to files:')
-            for file in files:
-                self.add_result(file)
+            self.add_results(['Data exported to files:'] + files)
             self.add_result('Export finished.', set_status=True)
             self.processing = False
 
@@ -267,8 +302,7 @@ class DbToolWindowClass(tk.Toplevel):
             if not messagebox.askyesno('Warning', 'This will delete all ASSETS in the database. Are you sure to continue ?'):
                 return
             self.processing = True
-            self.add_result('Processing...', set_status=True)
-            self.update()
+            self.begin_phase('Processing...')
             self.container.db_handler.delete_all_assets(keep_added_manually=False)
             self.add_result('All Assets have been deleted.', set_status=True)
             self.processing = False
@@ -283,8 +317,7 @@ class DbToolWindowClass(tk.Toplevel):
             if not messagebox.askyesno('Warning', 'This will make changes in the database. Are you sure to continue ?'):
                 return
             self.processing = True
-            self.add_result('Removing assets with no Asset_id...', set_status=True)
-            self.update()
+            self.begin_phase('Removing assets with no Asset_id...')
             self.container.db_handler.run_query("DELETE FROM assets WHERE asset_id == '' or asset_id is NULL")
             self.add_result('...Done. You should restart the App or Rebuild the data')
             self.add_result('Issues have been fixed.', set_status=True)
@@ -46,6 +46,7 @@ class EditRowWindow(tk.Toplevel):
         self.preview_scale: float = 0.25
         self.must_save: bool = False
         self.initial_values = []
+        self.entries: dict = {}  # widgets created by editable_table.edit_row(), reused when another row is edited
         self.width: int = width
         # the photoimage is stored is the variable to avoid garbage collection
         # see: https://stackoverflow.com/questions/30210618/image-not-getting-displayed-on-tkinter-through-label-widget
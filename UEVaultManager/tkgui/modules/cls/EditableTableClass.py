@@ -3,8 +3,8 @@
 Implementation for:
 - EditableTable: class that extends the pandastable.Table class, providing additional functionalities.
 """
-import io
 import os
+import threading
 import tkinter as tk
 import warnings
 import webbrowser
@@ -20,7 +20,7 @@ import UEVaultManager.tkgui.modules.functions as gui_f  # using the shortest var
 import UEVaultManager.tkgui.modules.functions_no_deps as gui_fn  # using the shortest variable name for globals for convenience
 import UEVaultManager.tkgui.modules.globals as gui_g  # using the shortest variable name for globals for convenience
 from UEVaultManager.lfs.utils import path_join
-from UEVaultManager.models.types import DateFormat
+from UEVaultManager.models.types import CSVFieldType, DateFormat
 from UEVaultManager.models.UEAssetClass import UEAsset
 from UEVaultManager.models.UEAssetDbHandlerClass import UEAssetDbHandler
 from UEVaultManager.models.UEAssetScraperClass import UEAssetScraper
@@ -29,7 +29,7 @@ from UEVaultManager.tkgui.modules.cls.EditCellWindowClass import EditCellWindow
 from UEVaultManager.tkgui.modules.cls.EditRowWindowClass import EditRowWindow
 from UEVaultManager.tkgui.modules.cls.ExtendedWidgetClasses import ExtendedCheckButton, ExtendedEntry, ExtendedText
 from UEVaultManager.tkgui.modules.cls.FakeProgressWindowClass import FakeProgressWindow
-from UEVaultManager.tkgui.modules.comp.functions_panda import fillna_fixed
+from UEVaultManager.tkgui.modules.comp.functions_panda import convert_column, fillna_fixed, read_csv
 from UEVaultManager.tkgui.modules.types import DataFrameUsed, DataSourceType
 from UEVaultManager.utils.cli import get_max_threads
 
@@ -79,9 +79,16 @@ class EditableTable(Table):
         self._last_selected_row: int = -1
         self._last_selected_col: int = -1
         self._last_cell_value: str = ''
-        self._changed_rows = []
-        self._deleted_asset_ids = []
+        self._changed_rows: set = set()  # real indexes of the rows to save
+        self._deleted_asset_ids: set = set()  # asset_ids of the rows to delete
         self._db_handler = None
+        self._last_validated_source: str = ''  # last data source checked by valid_source_type()
+        self._col_indexes: dict = {}  # cache for get_col_index()
+        self._redraw_id = None  # id of the redraw scheduled by schedule_redraw()
+        self._col_indexes_source = None  # columns used to fill self._col_indexes
+        # the fields definition never changes at runtime, so the names of the quick edit fields are computed only once
+        self._user_col_names: tuple = tuple(gui_t.get_csv_field_name_list(filter_on_states=[gui_t.CSVFieldState.USER]))
+        self._quick_edit_col_names: tuple = ('Asset_id', 'Url', 'Origin') + self._user_col_names  # fields to quick edit but with no type 'USER'
         self._frm_quick_edit = None
         self._frm_filter = None
         self._edit_row_window = None
@@ -264,10 +271,31 @@ class EditableTable(Table):
         :param event: event that triggered the function call.
         :param callback: callback function to call after the table has been redrawn.
 
-        Overrided for debugging
+        Overrided for debugging and to cancel a redraw scheduled by schedule_redraw()
         """
+        if self._redraw_id is not None:
+            # the scheduled redraw would do the same job
+            self.after_cancel(self._redraw_id)
+            self._redraw_id = None
         super().redraw(event, callback)
 
+    def schedule_redraw(self) -> None:
+        """
+        Redraw the table when tkinter is idle.
+
+        Notes:
+            Several calls are merged in one redraw, and a direct call to redraw() before that cancels it.
+        """
+        if self._redraw_id is None:
+            self._redraw_id = self.after_idle(self._redraw_when_idle)
+
+    def _redraw_when_idle(self) -> None:
+        """
+        Redraw the table scheduled by schedule_redraw().
+        """
+        self._redraw_id = None
+        self.redraw()
+
     def show(self, callback=None):
         """
         Show the table
@@ -449,23 +477,38 @@ class EditableTable(Table):
         df = self.get_data(df_type=self._dftype_for_coloring)
         rc = self.rowcolors
         rows = self.visiblerows
-        offset = rows[0]
         try:
             idx = df.index[rows]
         except IndexError:
             return
+        # these values are read once for all the cells
+        rc_columns = set(rc.columns)
+        df_columns = df.columns
+        cell_background = self.cellbackgr
+        get_cell_coords = self.getCellCoords
+        create_rectangle = self.create_rectangle
+        has_drawn = False
         for col in self.visiblecols:
-            colname = df.columns[col]
-            if colname in list(rc.columns):
+            colname = df_columns[col]
+            if colname in rc_columns:
                 try:
                     colors = rc[colname].loc[idx]  # loc checked
                 except KeyError:
                     colors = None
                 if colors is not None:
-                    for row in rows:
-                        clr = colors.iloc[row - offset]  # iloc checked
-                        if not pd.isnull(clr):
-                            self.drawRect(row, col, color=clr, tag='colorrect', delete=0)
+                    # the visible rows are consecutive, so the colors are in the same order
+                    for row, clr in zip(rows, colors.tolist()):
+                        if pd.isnull(clr) or clr == cell_background:
+                            continue
+                        # same rectangle as the one drawn by self.drawRect(row, col, color=clr, tag='colorrect', delete=0)
+                        # but drawRect() also lowers all the rectangles of the tag after each one, so it's done once at the end
+                        x1, y1, x2, y2 = get_cell_coords(row, col)
+                        create_rectangle(
+                            x1 + 0.5, y1 + 0.5, x2 - 0.5, y2 - 0.5, fill=clr, outline=clr, width=1, tag=('colorrect', f'cellbg{row}{col}')
+                        )
+                        has_drawn = True
+        if has_drawn:
+            self.lower('colorrect')
 
     def setColPositions(self):
         """
@@ -660,11 +703,15 @@ class EditableTable(Table):
             raise ValueError('frm_quick_edit can not be None')
         self._frm_quick_edit = frm_quick_edit
 
-    def set_columns_type(self, df: pd.DataFrame) -> pd.DataFrame:
+    def set_columns_type(self, df: pd.DataFrame, errors: list = None) -> pd.DataFrame:
         """
         Set the columns format for the table.
         :param df: dataframe to format.
+        :param errors: if not None, the error messages are added to this list instead of being notified.
         :return: formatted dataframe.
+
+        Notes:
+            The errors parameter must be used when called outside the main thread, because tkinter must only be used from the main thread.
         """
         # self.logger.info("\nCOL TYPES BEFORE CONVERSION\n")
         # df.info()  # direct print info
@@ -673,12 +720,13 @@ class EditableTable(Table):
             # at least 2 converters are expected: one for the convertion function and one for column type
             for converter in converters:
                 try:
-                    if callable(converter):
-                        df[col] = df[col].apply(converter)  # apply the converter function to the column
-                    else:
-                        df[col] = df[col].astype(converter)
+                    df[col] = convert_column(df[col], converter)
                 except (KeyError, ValueError) as error:
-                    self.notify(f'Could not convert column "{col}" using {converter}. Error: {error!r}')
+                    message = f'Could not convert column "{col}" using {converter}. Error: {error!r}'
+                    if errors is None:
+                        self.notify(message)
+                    else:
+                        errors.append(message)
         # self.notify("\nCOL TYPES AFTER CONVERSION\n",level='debug')
         # df.info()  # direct print info
         return df
@@ -935,6 +983,10 @@ class EditableTable(Table):
         Check if the file extension is valid for the current data source type.
         :param filename: filename to check.
         :return: True if the file extension is valid for the current data source type, False otherwise.
+
+        Notes:
+            The data source type is updated using the file extension.
+            The last validated filename is stored, read_data() uses it to skip the check when the data source has not changed.
         """
         file, ext = os.path.splitext(filename)
         type_saved = self.data_source_type
@@ -944,6 +996,7 @@ class EditableTable(Table):
             go_on = gui_f.box_yesno(
                 f'The type of data source has changed from the previous one.\nYou should quit and restart the application to avoid any data loss.\nAre you sure you want to continue ?'
             )
+        self._last_validated_source = filename if go_on else ''
         return go_on
 
     def read_data(self) -> Optional[pd.DataFrame]:
@@ -952,12 +1005,15 @@ class EditableTable(Table):
         :return: data loaded from the file or None if an error occurred.
         """
         self.must_rebuild = False
-        if not self.valid_source_type(self.data_source):
+        # on reload, the data source is the same and has already been checked
+        if self.data_source != self._last_validated_source and not self.valid_source_type(self.data_source):
             # noinspection PyTypeChecker
             return None
         try:
             if self.data_source_type == DataSourceType.FILE:
-                df = pd.read_csv(self.data_source, **gui_g.s.csv_options)
+                # the date fields are read as str, as the default engine does
+                date_columns = [col for col in gui_t.get_csv_field_name_list() if gui_t.get_field_type(col) == CSVFieldType.DATETIME]
+                df = read_csv(self.data_source, str_columns=date_columns, **gui_g.s.csv_options)
                 data_count = len(df)  # model. df checked
                 if data_count <= 0 or df.iat[0, 0] is None:  # iat checked
                     self.notify(f'Empty file: {self.data_source}. Adding a dummy row.')
@@ -973,8 +1029,8 @@ class EditableTable(Table):
                 if self._db_handler is None:
                     # could occur after a call to self.valid_source_type()
                     self._db_handler = UEAssetDbHandler(database_name=self.data_source)
-                data = self._db_handler.get_assets_data_for_csv()  # empty if database is new
-                column_names: list = self._db_handler.get_columns_name_for_csv()  # empty if database is new
+                # the column names are read from the same query. Both are empty if database is new
+                data, column_names = self._db_handler.get_assets_data_and_columns_for_csv()
                 # check to see if the first row has a value in the Uid column
                 if not column_names or not data or data[0][column_names.index('Uid')] is None:
                     self.notify(f'Empty file: {self.data_source}. Adding a dummy row.')
@@ -1013,9 +1069,8 @@ class EditableTable(Table):
         df = self.get_data()
         if self.data_source_type == DataSourceType.FILE:
             # create an empty row with the correct columns
-            col_data = gui_t.get_csv_field_name_list(return_as_string=True)  # column names
-            str_data = col_data + '\n' + gui_t.create_empty_csv_row(return_as_string=True)  # dummy row
-            table_row = pd.read_csv(io.StringIO(str_data), usecols=col_data.split(','), nrows=1, **gui_g.s.csv_options)
+            # the default values are already typed, so the row is built directly instead of parsing it from a csv string
+            table_row = pd.DataFrame([gui_t.create_empty_csv_row()], columns=gui_t.get_csv_field_name_list())
         elif self.is_using_database:
             # create an empty row (in the database) with the correct columns
             data = self._db_handler.create_empty_row(return_as_string=False, do_not_save=do_not_save)  # dummy row
@@ -1074,8 +1129,8 @@ class EditableTable(Table):
             row_numbers = [row_numbers]
         if not confirm_dialog or gui_f.box_yesno(f'Are you sure you want to delete {asset_str}? '):
             index_to_delete = []
+            df = self.get_data()
             for row_number in row_numbers:
-                df = self.get_data()
                 asset_id = gui_g.s.cell_is_empty_list[0]
                 idx = self.get_real_index(int(row_number), add_page_offset=True) if convert_to_index else row_number
                 if 0 <= idx <= len(df):
@@ -1086,23 +1141,27 @@ class EditableTable(Table):
                         self.logger.info(f'Adding row index {idx} with asset_id={asset_id} to the list of index to delete')
                     except (IndexError, KeyError) as error:
                         self.notify(f'Could add row index {idx} with asset_id={asset_id} to the list of index to delete. Error: {error!r}')
-
-                    # update the index copy column because index is changed after each deletion
-                    df[gui_g.s.index_copy_col_name] = df.index
+            if index_to_delete:
+                # update the index copy column. Done once because the index labels are not changed by the deletion of other rows
+                df[gui_g.s.index_copy_col_name] = df.index
+                index_checked = []
+                for idx in index_to_delete:
                     check_asset_id = df.at[idx, 'Asset_id']
                     # done one by on to check if the asset_id is still OK
                     if check_asset_id not in self._deleted_asset_ids:
                         self.notify(f'The row to delete with asset_id={check_asset_id} is not the good one', level='error')
                         # previous line will quit the application
                     else:
-                        try:
-                            df.drop(idx, inplace=True)
-                            # next changes will be done in self.update()
-                            # self.model.df.drop(idx, inplace=True)
-                            # if self.df_filtered is not None:
-                            #    self.df_filtered.drop(idx, inplace=True)
-                        except (IndexError, KeyError) as error:
-                            self.notify(f'Could not perform the deletion of list of indexes: {error!r}')
+                        index_checked.append(idx)
+                try:
+                    # all the rows are dropped at once, each drop rebuilds the dataframe
+                    df.drop(index_checked, inplace=True)
+                    # next changes will be done in self.update()
+                    # self.model.df.drop(idx, inplace=True)
+                    # if self.df_filtered is not None:
+                    #    self.df_filtered.drop(idx, inplace=True)
+                except (IndexError, KeyError) as error:
+                    self.notify(f'Could not perform the deletion of list of indexes: {error!r}')
 
             self.selectNone()
             self.update_index_copy_column()
@@ -1122,37 +1181,54 @@ class EditableTable(Table):
         else:
             return False
 
-    def save_row_in_db(self, row_index: int):
+    def _get_asset_data_to_save(self, row_index: int, asset_data: dict = None) -> Optional[dict]:
         """
-        Save a row in the database.
+        Get the data of a row to save in the database.
         :param row_index: row index to save.
+        :param asset_data: data of the row, already converted to the database column names. If None, it will be read from the table.
+        :return: asset data to save or None if the row must not be saved.
         """
-        row_data = self.get_row(row_index, return_as_dict=True)
-        if row_data is None:
-            return
-        asset_id = row_data.get('Asset_id', '')
+        if asset_data is None:
+            row_data = self.get_row(row_index, return_as_dict=True)
+            if row_data is None:
+                return None
+            # convert the key names to the database column names
+            asset_data = gui_t.convert_csv_row_to_sql_row(row_data)
+        asset_id = asset_data.get('asset_id', '')
         if asset_id.startswith(gui_g.s.temp_id_prefix) and not gui_g.s.keep_invalid_scans:
             # this a new row , partialled empty, created before scraping the data.
             # No need to save it, It will produce a database error.
             # It will be saved after scraping
-            return
+            return None
         if asset_id in gui_g.s.cell_is_empty_list and asset_id in gui_g.s.cell_is_empty_list:
             self.notify(f'The asset for row index {row_index + 1} is missing asset_id or if field value. Bypassing the save.')
-            return
+            return None
         if asset_id in self._deleted_asset_ids:
             # do not update an asset if that will be deleted
-            return
-        # convert the key names to the database column names
-        asset_data = gui_t.convert_csv_row_to_sql_row(row_data)
+            return None
         ue_asset = UEAsset()
         try:
             ue_asset.init_from_dict(asset_data)
-            # update the row in the database
             tags = ue_asset.get('tags', [])
-            # tags = self._db_handler.convert_tag_list_to_string(tags) # done in save_ue_asset()
+            # tags = self._db_handler.convert_tag_list_to_string(tags) # done in set_assets()
             ue_asset.set('tags', tags)
-            self._db_handler.save_ue_asset(ue_asset)
-            asset_id = ue_asset.get('asset_id', '')
+        except (KeyError, ValueError, AttributeError) as error:
+            self.notify(f'Failed to save UE_asset for row index {row_index + 1} to the database: {error!r}')
+            return None
+        return ue_asset.get_data()
+
+    def save_row_in_db(self, row_index: int):
+        """
+        Save a row in the database.
+        :param row_index: row index to save.
+        """
+        asset_data = self._get_asset_data_to_save(row_index)
+        if asset_data is None:
+            return
+        try:
+            # update the row in the database
+            self._db_handler.set_assets([asset_data])
+            asset_id = asset_data.get('asset_id', '')
             self.logger.info(f'UE_asset ({asset_id}) for row index {row_index + 1} has been saved to the database')
         except (KeyError, ValueError, AttributeError) as error:
             self.notify(f'Failed to save UE_asset for row index {row_index + 1} to the database: {error!r}')
@@ -1164,19 +1240,46 @@ class EditableTable(Table):
         if source_type is None:
             source_type = self.data_source_type
         df = self.get_data(df_type=DataFrameUsed.AUTO)
-        self.updateModel(TableModel(df))  # needed to restore all the data and not only the current page
+        # needed to restore all the data and not only the current page
+        # the dataframe is set directly, updateModel() would also notify the table change and adjust the column widths on all the data
+        # the current page is set back by update_page() at the end
+        self.model.df = df  # model. df checked
         if source_type == DataSourceType.FILE:
             df.to_csv(self.data_source, index=False, na_rep='', date_format=DateFormat.csv)
         else:
-            for row_index in self._changed_rows:
-                self.save_row_in_db(row_index)
-            for asset_id in self._deleted_asset_ids:
+            # all the changed rows are saved with a single commit
+            assets_to_save = []
+            # the real indexes of the changed rows are positions in the unfiltered dataframe
+            df_unfiltered = self.get_data(df_type=DataFrameUsed.UNFILTERED)
+            row_indexes = []
+            for row_index in sorted(self._changed_rows):
+                if row_index < len(df_unfiltered):
+                    row_indexes.append(row_index)
+                else:
+                    self.notify(f'Could not save the row index {row_index} to the database: it is out of the datatable range.')
+            # the key names of all the changed rows are converted to the database column names at once
+            csv_to_sql = gui_t.get_csv_to_sql_field_mapping()
+            changed_df = df_unfiltered.iloc[row_indexes]  # iloc checked
+            changed_df = changed_df[[col for col in changed_df.columns if col in csv_to_sql]].rename(columns=csv_to_sql)
+            # some csv fields use the same database column, keep the last one as convert_csv_row_to_sql_row() does
+            changed_df = changed_df.loc[:, ~changed_df.columns.duplicated(keep='last')]
+            for row_index, asset_data in zip(row_indexes, changed_df.to_dict(orient='records')):
+                asset_data = self._get_asset_data_to_save(row_index, asset_data)
+                if asset_data is not None:
+                    assets_to_save.append(asset_data)
+            if assets_to_save:
                 try:
-                    # delete the row in the database
-                    self._db_handler.delete_asset(asset_id=asset_id)
-                    self.logger.info(f'Row with asset_id={asset_id} has been deleted from the database')
+                    self._db_handler.set_assets(assets_to_save)
+                    self.logger.info(f'{len(assets_to_save)} UE_assets have been saved to the database')
                 except (KeyError, ValueError, AttributeError) as error:
-                    self.notify(f'Failed to delete asset_id={asset_id} to the database. Error: {error!r}')
+                    self.notify(f'Failed to save the UE_assets to the database: {error!r}')
+            if self._deleted_asset_ids:
+                try:
+                    # delete the rows in the database
+                    self._db_handler.delete_assets(asset_ids=self._deleted_asset_ids)
+                    self.logger.info(f'Rows with asset_id in {self._deleted_asset_ids} have been deleted from the database')
+                except (KeyError, ValueError, AttributeError) as error:
+                    self.notify(f'Failed to delete asset_ids={self._deleted_asset_ids} to the database. Error: {error!r}')
 
         self.clear_rows_to_save()
         self.clear_asset_ids_to_delete()
@@ -1300,20 +1403,19 @@ class EditableTable(Table):
         if col_names is None:
             return
         df = self.get_data(df_type=self._dftype_for_coloring)
+        rc = self.rowcolors
         for col_name in col_names:
             try:
                 x = df[col_name]
-                if min_val is None:
-                    min_val = x.min()
-                if max_val is None:
-                    max_val = x.max()
-                x = (x - min_val) / (max_val - min_val)
+                # the min and max values of a column must not be reused for the next one
+                col_min_val = x.min() if min_val is None else min_val
+                col_max_val = x.max() if max_val is None else max_val
+                x = (x - col_min_val) / (col_max_val - col_min_val)
                 if is_reversed:
-                    x = max_val - x
+                    x = col_max_val - x
                 clrs = self.values_to_colors(x, cmap, alpha)
-                clrs = pd.Series(clrs, index=df.index)
-                rc = self.rowcolors
-                rc[col_name] = clrs
+                # the colors are aligned on the index of the data, rowcolors could use another one (see resetColors)
+                rc[col_name] = pd.Series(clrs, index=df.index)
             except (KeyError, ValueError, TypeError) as error:
                 self.notify(f'gradient_color_cells: An error as occured with {col_name} : {error!r}', level='debug')
                 continue
@@ -1346,6 +1448,9 @@ class EditableTable(Table):
         df = self.get_data(df_type=self._dftype_for_coloring)
         for col_name in col_names:
             mask = df[col_name] == value_to_check
+            if not mask.any():
+                # no cell to color
+                continue
             try:
                 self.setColorByMask(col=col_name, mask=mask, clr=color)
             except (KeyError, ValueError) as error:
@@ -1367,6 +1472,9 @@ class EditableTable(Table):
         for col_name in col_names:
             try:
                 mask = df[col_name] != value_to_check
+                if not mask.any():
+                    # no cell to color
+                    continue
                 self.setColorByMask(col=col_name, mask=mask, clr=color)
             except (KeyError, ValueError) as error:
                 self.notify(f'color_cells_if_not: An error as occured with {col_name} : {error!r}', level='debug')
@@ -1378,18 +1486,39 @@ class EditableTable(Table):
         :param col_name_to_check: name of the column to check for the value.
         :param color: color to set the row to.
         :param value_to_check: value to check for.
+        """
+        self.color_rows_by_rules([(col_name_to_check, value_to_check, color)])
+
+    def color_rows_by_rules(self, rules: list) -> None:
+        """
+        Set the row color for the rows with a given value in a column, for several rules at once.
+        :param rules: list of (col_name_to_check, value_to_check, color) tuples. If several rules match a row, the last one is used.
 
         Notes:
             Called by set_colors() on each update
+            The colors of all the rules are merged before being applied, so each column is only updated once.
         """
-
         df = self.get_data(df_type=self._dftype_for_coloring)
-        mask = df[col_name_to_check] == value_to_check
+        row_colors = pd.Series(None, index=df.index, dtype=object)
+        for col_name_to_check, value_to_check, color in rules:
+            if col_name_to_check not in df.columns:
+                continue
+            row_colors = row_colors.mask(df[col_name_to_check] == value_to_check, color)
+        if not row_colors.notna().any():
+            # no row to color, the colors would be applied to each column for nothing
+            return
+        if len(self.rowcolors) == 0:
+            self.resetColors()
+        rc = self.rowcolors
+        row_colors = row_colors.reindex(rc.index)
+        mask = row_colors.notna()
         for col_name in df.columns:
             try:
-                self.setColorByMask(col=col_name, mask=mask, clr=color)
+                if col_name not in rc.columns:
+                    rc[col_name] = pd.Series()
+                rc[col_name] = rc[col_name].mask(mask, row_colors)
             except (KeyError, ValueError) as error:
-                self.notify(f'color_rows_if: An error as occured with {col_name} : {error!r}', level='debug')
+                self.notify(f'color_rows_by_rules: An error as occured with {col_name} : {error!r}', level='debug')
 
     def set_preferences(self, default_pref=None) -> None:
         """
@@ -1442,8 +1571,7 @@ class EditableTable(Table):
         self.color_cells_if(col_names=['Owned', 'Discounted'], color='palegreen', value_to_check=True)
         self.color_cells_if(col_names=['Grab result'], color='skyblue', value_to_check='NO_ERROR')
         self.color_cells_if_not(col_names=['Status'], color='darkgrey', value_to_check='ACTIVE')
-        self.color_rows_if(col_name_to_check='Status', color='darkgrey', value_to_check='SUNSET')
-        self.color_rows_if(col_name_to_check='Obsolete', color='dimgrey', value_to_check=True)
+        self.color_rows_by_rules([('Status', 'SUNSET', 'darkgrey'), ('Obsolete', True, 'dimgrey')])
         self.color_cells_if_not(col_names=['Downloaded size'], color='palegreen', value_to_check='')
         self.redraw()
 
@@ -1468,11 +1596,24 @@ class EditableTable(Table):
         Update the index copy column for the 3 dataframes. Must be called when rows are added or deleted
         """
         self.df_unfiltered.reset_index(drop=True, inplace=True)
-        self.df_unfiltered[gui_g.s.index_copy_col_name] = self.df_unfiltered.index
-        if self.df_filtered is not None:
-            self.df_filtered[gui_g.s.index_copy_col_name] = self.df_filtered.index
-        if self.model.df is not None:
-            self.model.df[gui_g.s.index_copy_col_name] = self.model.df.index
+        self._update_index_copy_column()
+
+    def _update_index_copy_column(self, include_model: bool = True) -> None:
+        """
+        Copy the index values in the index copy column of the 3 dataframes.
+        :param include_model: True to also update the dataframe of the model.
+
+        Notes:
+            Without filter or pagination, the dataframes are the same object, so the column is only copied once.
+        """
+        col_name = gui_g.s.index_copy_col_name
+        updated = []
+        dataframes = (self.df_unfiltered, self.df_filtered, self.model.df) if include_model else (self.df_unfiltered, self.df_filtered)
+        for df in dataframes:
+            if df is None or any(df is df_updated for df_updated in updated):
+                continue
+            df[col_name] = df.index
+            updated.append(df)
 
     def update(self, reset_page: bool = False, update_format: bool = False) -> None:
         """
@@ -1486,7 +1627,36 @@ class EditableTable(Table):
         if update_format:
             # Done here because the changes in the unfiltered dataframe will be copied to the filtered dataframe
             gui_f.show_progress(self, text='Formating and converting DataTable...', keep_existing=True)
-            self.set_data(self.set_columns_type(df))
+            # the conversion is done in a separate thread to keep the progress window refreshed, it could take some time with lots of rows
+            errors = []
+            exceptions = []
+            # the thread converts a copy, so the callbacks run during the conversion never see a partially converted dataframe
+            df_converted = df.copy()
+
+            def _set_columns_type_in_thread() -> None:
+                """ Convert the columns of the copy and keep the exception to raise it in the main thread. """
+                try:
+                    self.set_columns_type(df_converted, errors)
+                except (Exception, ) as _error:
+                    exceptions.append(_error)
+
+            if self._redraw_id is not None:
+                # no need to redraw the data that will be replaced by the converted copy
+                self.after_cancel(self._redraw_id)
+                self._redraw_id = None
+            t = threading.Thread(target=_set_columns_type_in_thread, name='Format_DataTable')
+            t.start()
+            while t.is_alive():
+                # only the idle tasks are processed, the user events would be able to change the data during the conversion
+                self.update_idletasks()
+                t.join(0.05)
+            for message in errors:
+                self.notify(message)
+            if exceptions:
+                gui_f.close_progress(self)
+                raise exceptions[0]
+            df = df_converted
+            self.set_data(df)
             fillna_fixed(df)
             if self._frm_filter is not None:
                 self._frm_filter.clear_filter()
@@ -1548,6 +1718,9 @@ class EditableTable(Table):
         if not keep_col_infos:
             self._column_infos_saved = self.get_col_infos()  # stores col infos BEFORE self.model.df is updated
         df = self.get_data(df_type=DataFrameUsed.AUTO)
+        # backup index value
+        # done on the full dataframes BEFORE getting the page, so the page already contains the column and is not written
+        self._update_index_copy_column(include_model=False)
         try:
             # self.model could be None before load_data is called
             if self.pagination_enabled:
@@ -1562,11 +1735,6 @@ class EditableTable(Table):
                 self.total_pages = 1
         except IndexError:
             self.current_page = 1
-        # backup index value
-        self.df_unfiltered[gui_g.s.index_copy_col_name] = self.df_unfiltered.index
-        self.model.df[gui_g.s.index_copy_col_name] = self.model.df.index
-        if self.df_filtered is not None:
-            self.df_filtered[gui_g.s.index_copy_col_name] = self.df_filtered.index
         # check if the columns order has changed
         new_cols_infos = self.get_col_infos()
         if self._column_infos_saved != new_cols_infos:
@@ -1692,30 +1860,28 @@ class EditableTable(Table):
             self.tableChanged() is called if some rows must be saved
         """
         self.tableChanged()  # to force a controls update
-        if row_index < 0 or row_index > len(self.get_data()) or row_index in self._changed_rows:
+        if row_index < 0 or row_index > len(self.get_data()):
             return
-        self._changed_rows.append(row_index)
+        self._changed_rows.add(row_index)
 
     def clear_rows_to_save(self) -> None:
         """
         Clear the list of rows to save.
         """
-        self._changed_rows = []
+        self._changed_rows.clear()
 
     def add_to_asset_ids_to_delete(self, asset_id: str) -> None:
         """
         Adds the specified row to the list of rows to delete.
         :param asset_id: asset_id of the row to delete.
         """
-        if asset_id in self._deleted_asset_ids:
-            return
-        self._deleted_asset_ids.append(asset_id)
+        self._deleted_asset_ids.add(asset_id)
 
     def clear_asset_ids_to_delete(self) -> None:
         """
         Clear the list of asset_ids to delete.
         """
-        self._deleted_asset_ids = []
+        self._deleted_asset_ids.clear()
 
     def get_row(self, row_index: int, return_as_dict: bool = False):
         """
@@ -1753,14 +1919,15 @@ class EditableTable(Table):
         text = f'Row #{row_number + 1}' if convert_row_number_to_row_index else f'row index {row_number}'
         self.logger.info(f'Updating {text} with asset_id={asset_id}')
         error_count = 0
+        asset_only_fields = gui_t.get_csv_field_names_on_states([gui_t.CSVFieldState.ASSET_ONLY])
         for key, value in ue_asset_data.items():
-            typed_value = gui_t.get_typed_value(sql_field=key, value=value)
+            if key in asset_only_fields:
+                continue
             # get the column index of the key
             col_name = gui_t.get_csv_field_name(key)
-            if gui_t.is_on_state(key, [gui_t.CSVFieldState.ASSET_ONLY]):
-                continue
             col_index = self.get_col_index(col_name)  # return -1 col_name is not on the table
             if col_index >= 0:
+                typed_value = gui_t.get_typed_value(csv_field=col_name, value=value)
                 if not self.update_cell(row_number, col_index, typed_value, convert_row_number_to_row_index):
                     error_count += 1
         if error_count > 0:
@@ -1783,11 +1950,18 @@ class EditableTable(Table):
         Return the index of the column with the specified name.
         :param col_name: column name.
         :return: index of the column with the specified name or -1 if the column name is not found.
+
+        Notes:
+            The indexes are cached until the columns of the data change. Pandas creates a new columns object on each change.
         """
-        try:
-            return self.get_data().columns.get_loc(col_name)  # Use Unfiltered here to be sure to have all the columns
-        except KeyError:
-            return -1
+        columns = self.get_data().columns  # Use Unfiltered here to be sure to have all the columns
+        if columns is not self._col_indexes_source:
+            col_indexes = {}
+            for index, name in enumerate(columns):
+                col_indexes.setdefault(name, index)
+            self._col_indexes = col_indexes
+            self._col_indexes_source = columns
+        return self._col_indexes.get(col_name, -1)
 
     def get_cell(self, row_number: int = -1, col_index: int = -1, convert_row_number_to_row_index: bool = True):
         """
@@ -1854,12 +2028,13 @@ class EditableTable(Table):
             return {}
         entries_values = {}
         for key, entry in self._edit_row_entries.items():
-            try:
-                value = entry.get()
-            except AttributeError:
-                value = entry.get_content()  # for extendedWidgets
-            except TypeError:
+            # the getter is chosen from the widget class, raising and catching an exception for each widget is slower
+            if isinstance(entry, tk.Text):
                 value = entry.get('1.0', tk.END)
+            elif isinstance(entry, ExtendedCheckButton):
+                value = entry.get_content()  # for extendedWidgets
+            else:
+                value = entry.get()
             entries_values[key] = value
         return entries_values
 
@@ -1916,60 +2091,75 @@ class EditableTable(Table):
         if row_data is None:
             self.notify(f'edit_row: row_data is None for index #{idx}')
             return
-        entries = {}
+        entries = edit_row_window.entries
         image_url = ''
-        previous_was_a_bool = False
-        row = 0
-        # noinspection GrazieInspection
-        hidden_col_list = [gui_g.s.index_copy_col_name, 'Long description'] + gui_g.s.hidden_column_names
-        hidden_col_list_lower = [col.lower() for col in hidden_col_list]
-        for key, value in row_data.items():
-            # print(f'row {row}:key={key} value={value} previous_was_a_bool={previous_was_a_bool})  # debug only
-            key_lower = key.lower()
-            if key_lower in hidden_col_list_lower:
-                continue
-            if gui_t.is_on_state(key, [gui_t.CSVFieldState.ASSET_ONLY]):
-                continue
-            label = gui_t.get_label_for_field(key)
-
-            if key_lower == 'image':
-                image_url = value
-            if gui_t.is_from_type(key, [gui_t.CSVFieldType.TEXT]):
-                if previous_was_a_bool:
-                    row += 1  # the previous row was a bool, we have to move to the next row
-                previous_was_a_bool = False
-                ttk.Label(edit_row_window.frm_content, text=label).grid(row=row, column=0, sticky=tk.W)
-                entry = ExtendedText(edit_row_window.frm_content, height=3)
-                entry.set_content(value)
-                entry.grid(row=row, column=1, columnspan=3, sticky=tk.EW)
-            elif gui_t.is_from_type(key, [gui_t.CSVFieldType.BOOL]):
-                # values by default. keep here !
-                col_span = 1
-                if previous_was_a_bool:
-                    col_label = 2
-                    col_value = 3
+        if entries:
+            # the widgets created for a previous row are reused, the columns and their layout do not change
+            for key, entry in entries.items():
+                value = row_data.get(key, '')
+                if key.lower() == 'image':
+                    image_url = value
+                if isinstance(entry, ttk.Entry):
+                    entry.delete(0, tk.END)
+                    entry.insert(0, value)
                 else:
-                    col_label = 0
-                    col_value = 1
-                ttk.Label(edit_row_window.frm_content, text=label).grid(row=row, column=col_label, sticky=tk.W)
-                entry = ExtendedCheckButton(edit_row_window.frm_content, label='', images_folder=gui_g.s.assets_folder)
-                entry.set_content(value)
-                entry.grid(row=row, column=col_value, columnspan=col_span, sticky=tk.EW)
-                previous_was_a_bool = not previous_was_a_bool
-                if previous_was_a_bool:
-                    row -= 1  # we stay on the same row for the next loop
-                # TODO : add other extended widget for specific type (CSVFieldType.DATETIME , CSVFieldType.LIST)
-            else:
-                # other field is just a usual entry
-                if previous_was_a_bool:
-                    row += 1  # the previous row was a bool, we have to move to the next row
-                previous_was_a_bool = False
-                ttk.Label(edit_row_window.frm_content, text=label).grid(row=row, column=0, sticky=tk.W)
-                entry = ttk.Entry(edit_row_window.frm_content)
-                entry.insert(0, value)
-                entry.grid(row=row, column=1, columnspan=3, sticky=tk.EW)
-            row += 1
-            entries[key] = entry
+                    entry.set_content(value)
+        else:
+            previous_was_a_bool = False
+            row = 0
+            # noinspection GrazieInspection
+            hidden_col_list = [gui_g.s.index_copy_col_name, 'Long description'] + gui_g.s.hidden_column_names
+            hidden_col_list_lower = {col.lower() for col in hidden_col_list}
+            asset_only_fields = gui_t.get_csv_field_names_on_states([gui_t.CSVFieldState.ASSET_ONLY])
+            for key, value in row_data.items():
+                # print(f'row {row}:key={key} value={value} previous_was_a_bool={previous_was_a_bool})  # debug only
+                key_lower = key.lower()
+                if key_lower in hidden_col_list_lower:
+                    continue
+                if key in asset_only_fields:
+                    continue
+                label = gui_t.get_label_for_field(key)
+
+                if key_lower == 'image':
+                    image_url = value
+                field_type = gui_t.get_field_type(key)  # None if the field is unknown
+                if field_type == gui_t.CSVFieldType.TEXT:
+                    if previous_was_a_bool:
+                        row += 1  # the previous row was a bool, we have to move to the next row
+                    previous_was_a_bool = False
+                    ttk.Label(edit_row_window.frm_content, text=label).grid(row=row, column=0, sticky=tk.W)
+                    entry = ExtendedText(edit_row_window.frm_content, height=3)
+                    entry.set_content(value)
+                    entry.grid(row=row, column=1, columnspan=3, sticky=tk.EW)
+                elif field_type == gui_t.CSVFieldType.BOOL:
+                    # values by default. keep here !
+                    col_span = 1
+                    if previous_was_a_bool:
+                        col_label = 2
+                        col_value = 3
+                    else:
+                        col_label = 0
+                        col_value = 1
+                    ttk.Label(edit_row_window.frm_content, text=label).grid(row=row, column=col_label, sticky=tk.W)
+                    entry = ExtendedCheckButton(edit_row_window.frm_content, label='', images_folder=gui_g.s.assets_folder)
+                    entry.set_content(value)
+                    entry.grid(row=row, column=col_value, columnspan=col_span, sticky=tk.EW)
+                    previous_was_a_bool = not previous_was_a_bool
+                    if previous_was_a_bool:
+                        row -= 1  # we stay on the same row for the next loop
+                    # TODO : add other extended widget for specific type (CSVFieldType.DATETIME , CSVFieldType.LIST)
+                else:
+                    # other field is just a usual entry
+                    if previous_was_a_bool:
+                        row += 1  # the previous row was a bool, we have to move to the next row
+                    previous_was_a_bool = False
+                    ttk.Label(edit_row_window.frm_content, text=label).grid(row=row, column=0, sticky=tk.W)
+                    entry = ttk.Entry(edit_row_window.frm_content)
+                    entry.insert(0, value)
+                    entry.grid(row=row, column=1, columnspan=3, sticky=tk.EW)
+                row += 1
+                entries[key] = entry
+            edit_row_window.entries = entries
         self._edit_row_entries = entries
         self._edit_row_number = row_number
         self._edit_row_window = edit_row_window
@@ -1985,9 +2175,11 @@ class EditableTable(Table):
         Save the edited row values to the table data.
         """
         row_number = self._edit_row_number
+        # the real index is the same for all the cells of the row, so it's converted once
+        idx = self.get_real_index(row_number)
         for col_name, value in self.get_edited_row_values().items():
             col_index = self.get_col_index(col_name)
-            value_saved = self.get_cell(row_number, col_index)
+            value_saved = self.get_cell(idx, col_index, convert_row_number_to_row_index=False)
             typed_value_saved = gui_t.get_typed_value(csv_field=col_name, value=value_saved)
             typed_value = gui_t.get_typed_value(csv_field=col_name, value=value)
             try:
@@ -2000,12 +2192,11 @@ class EditableTable(Table):
                     'Usually, the "installed folders" field should not be manually change to avoid incoherent data.\nAre you sure you want to change this value ?'
                 ):
                     continue
-            if not self.update_cell(row_number, col_index, typed_value):
+            if not self.update_cell(idx, col_index, typed_value, convert_row_number_to_row_index=False):
                 self.notify(f'Failed to update the row #{row_number + 1}')
                 continue
         self._edit_row_entries = None
         self._edit_row_number = -1
-        idx = self.get_real_index(row_number)
         self.add_to_rows_to_save(idx)  # self.must_save = True is done inside
         self._edit_row_window.close_window()
         self.update()  # this call will copy the changes to model. df AND to self.filtered_df
@@ -2097,20 +2288,31 @@ class EditableTable(Table):
         col_installed_folders = self.get_col_index('Installed folders')
         has_already_confirmed = False
         idx = -1
-        for row_number in self._edit_cell_row_numbers:
+        col_index = self._edit_cell_col_index
+        tag = widget.tag
+        try:
+            # the same value is set in all the edited rows, so it is read and typed once
+            value = widget.get_content()
+        except TypeError as error:
+            self.notify(f'Failed to get content of {widget}: {error!r}')
+            value = ''
+            row_numbers = []
+        else:
+            row_numbers = self._edit_cell_row_numbers
+        typed_value = gui_t.get_typed_value(csv_field=tag, value=value)
+        try:
+            typed_value = typed_value.strip('\n\t\r')  # remove unwanted characters
+        except AttributeError:
+            # no strip method for the typed_value
+            pass
+        for row_number in row_numbers:
             try:
-                tag = self._edit_cell_widget.tag
-                value = self._edit_cell_widget.get_content()
-                col_index = self._edit_cell_col_index
                 value_saved = self.get_cell(row_number, col_index)
                 typed_value_saved = gui_t.get_typed_value(csv_field=tag, value=value_saved)
-                typed_value = gui_t.get_typed_value(csv_field=tag, value=value)
-                try:
-                    typed_value = typed_value.strip('\n\t\r')  # remove unwanted characters
-                except AttributeError:
-                    # no strip method for the typed_value
-                    pass
-                if col_index == col_installed_folders and typed_value != gui_g.s.empty_cell and typed_value != typed_value_saved:
+                if typed_value == typed_value_saved:
+                    # no change, the row does not need to be saved
+                    continue
+                if col_index == col_installed_folders and typed_value != gui_g.s.empty_cell:
                     if has_already_confirmed or not gui_f.box_yesno(
                         'Usually, the "installed folders" field should not be manually change to avoid incoherent data.\nAre you sure you want to change this value ?'
                     ):
@@ -2121,7 +2323,7 @@ class EditableTable(Table):
                     self.notify(f'Failed to update the row #{row_number + 1}')
                     continue
             except TypeError as error:
-                self.notify(f'Failed to get content of {widget}: {error!r}')
+                self.notify(f'Failed to update the row #{row_number + 1}: {error!r}')
                 continue
             idx = self.get_real_index(row_number)
             self.add_to_rows_to_save(idx)  # self.must_save = Trueis done inside
@@ -2131,7 +2333,9 @@ class EditableTable(Table):
         self._edit_cell_row_numbers = []
         self._edit_cell_col_index = -1
         self._edit_cell_window.close_window()
-        self.update()  # this call will copy the changes to model. df AND to self.filtered_df
+        if idx >= 0:
+            # at least one cell has changed
+            self.update()  # this call will copy the changes to model. df AND to self.filtered_df
 
     def update_quick_edit(self, row_number: int = None) -> None:
         """
@@ -2147,9 +2351,7 @@ class EditableTable(Table):
         if row_number is None or row_number >= len(self.get_data(df_type=DataFrameUsed.MODEL)) or frm_quick_edit is None:
             return
 
-        column_names = ['Asset_id', 'Url', 'Origin']  # fields to quick edit but with no type 'USER'
-        column_names.extend(gui_t.get_csv_field_name_list(filter_on_states=[gui_t.CSVFieldState.USER]))
-        for col_name in column_names:
+        for col_name in self._quick_edit_col_names:
             col_index = self.get_col_index(col_name)
             value = self.get_cell(row_number, col_index)
             if col_name == 'Asset_id':
@@ -2166,8 +2368,7 @@ class EditableTable(Table):
         Reset the cell content preview.
         """
         self._frm_quick_edit.config(text='Select a row for Quick Editing its USER FIELDS')
-        column_names = gui_t.get_csv_field_name_list(filter_on_states=[gui_t.CSVFieldState.USER])
-        for col_name in column_names:
+        for col_name in self._user_col_names:
             self._frm_quick_edit.set_default_content(col_name)
 
     def save_quick_edit_cell(self, row_number: int = -1, col_index: int = -1, value: str = '', tag: str = None) -> None:
@@ -2338,12 +2539,12 @@ class EditableTable(Table):
     def reset_style(self) -> None:
         """
         Reset the table style. Usefull when style of the main ttk window has changed.
+
+        Notes:
+            The dataframes have no style to clear: each access to df.style builds a new Styler over all the data, and pandastable does not use it.
+            The redraw is scheduled because the callers (edit windows closing) are usually followed by an update of the table.
         """
-        self.get_data(df_type=DataFrameUsed.UNFILTERED).style.clear()
-        df = self.get_data(df_type=DataFrameUsed.FILTERED)
-        if df is not None:
-            df.style.clear()
-        self.redraw()
+        self.schedule_redraw()
 
     def notify(self, message: str, level='warning') -> None:
         """
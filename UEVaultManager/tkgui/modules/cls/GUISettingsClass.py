@@ -33,6 +33,67 @@ class GUISettings:
     data_filetypes_db = (('SQlite file', '*.db'), )
     data_filetypes_csv = (('csv file', '*.csv'), ('tcsv file', '*.tcsv'))
     data_filetypes = data_filetypes_all + data_filetypes_text + data_filetypes_json + data_filetypes_db + data_filetypes_csv
+    # the following values are never changed by the config file, so they are shared by all the instances
+    backup_file_ext: str = '.BAK'
+    default_filename: str = 'assets'
+    # if a file extension is in this tuple, the parent folder is considered as a valid UE folder
+    ue_valid_file_ext = ('.uplugin', '.uproject')  # MUST BE LOWERCASE for comparison
+    # if a folder is in this tuple, the parent folder is considered as a valid ue folder
+    ue_valid_asset_subfolder = ('content', 'Content')  # must be a tuple.
+    # if a folder is in this tuple, the parent folder is considered as a valid ue folder for a manifest file
+    ue_valid_manifest_subfolder = ('data', 'Data')  # must be a tuple.
+    # subfolder to store an ASSET content for an installation or a download or a scan (same value)
+    ue_asset_content_subfolder: str = 'Content'
+    # subfolder to store a PLUGIN for a download in the vaultCache folder
+    ue_plugin_vaultcache_subfolder: str = 'data'
+    # subfolder to store a PLUGIN for a download in the vaultCache folder
+    ue_plugin_project_subfolder: str = 'Plugins'
+    # subfolder to store a PLUGIN for an installation in an ENGINE folder (relativelly to the base folder of the engine).
+    # USE '/' as separator ! important for path_join
+    ue_plugin_install_subfolder: str = 'Engine/Plugins/Marketplace'
+    # file name of a UE manifest file
+    ue_manifest_filename: str = 'manifest'
+    # value in orgin column for a marketplace asset
+    origin_marketplace = 'Marketplace'
+
+    index_copy_col_name: str = 'Index copy'
+    group_col_name: str = 'In group'  # could not be 'group' because it's a reserved word in sqlite
+    # if a folder is in this tuple, the folder won't be scanned to find ue folders
+    ue_invalid_content_subfolder = (
+        'binaries', 'build', 'deriveddatacache', 'intermediate', 'saved', 'data'
+    )  # must be a tuple. MUST BE LOWERCASE for comparison
+    # if a folder is in this tuple, the folder could be a valid folder but with an incomplete structure
+    ue_possible_asset_subfolder = ('blueprints', 'maps', 'textures', 'materials')  # must be a tuple. MUST BE LOWERCASE for comparison
+    # Notes on testing_switch vamues:
+    # 0: normal mode, no changes in code
+    # 1: testing mode, limit the number of assets to process in several actions
+    # 2: fix the value and limit the number of folders to scan for assets
+    testing_assets_limit: int = 300  # when testing (ie testing_switch==1) , limit the number of assets to process to this value
+    app_monitor: int = 1
+    preview_max_width: int = 150
+    preview_max_height: int = 150
+    default_global_search: str = 'Text to search...'
+    default_value_for_all: str = 'All'
+    keyword_query_string = 'QUERY'  # use this keyword in a CALLABLE filter to replace the value by the in the search field
+    empty_cell: str = ''
+    empty_row_prefix: str = 'new_id_'
+    duplicate_row_prefix: str = 'local_id_'
+    temp_id_prefix: str = 'temp_id_'
+    unknown_size: str = 'yes'
+    tag_prefix: str = 't_'
+    expand_columns_factor: int = 20
+    contract_columns_factor: int = 20
+    warning_limit_for_batch_op: int = 20
+    engine_version_for_obsolete_assets: str = '4.26'  # fallback value when cli.core.engine_version_for_obsolete_assets is not available without import
+    notification_time = 10000  # time in ms to keep notification window on screen
+
+    # ttkbootstrap themes:
+    # light themes : "cosmo", "flatly", "litera", "minty", "lumen", "sandstone", "yeti", "pulse", "united", "morph", "journal", "simplex", "cerculean"
+    # dark themes: "darkly", "superhero", "solar", "cyborg", "vapor"
+    theme_name: str = 'lumen'
+    theme_font = ('Verdana', 8)
+    # category of an incomplete asset, also added to asset_categories
+    missing_category = 'Incomplete Asset'
 
     def __init__(self, config_file=None):
         self.config = AppConfig(comment_prefixes='/', allow_no_value=True)
@@ -57,36 +118,6 @@ class GUISettings:
         self.assets_csv_files_folder: str = path_join(self.scraping_folder, 'csv')
         self.filters_folder: str = path_join(self.path, 'filters')
         self.backups_folder: str = path_join(self.scraping_folder, 'backups')
-        self.backup_file_ext: str = '.BAK'
-        self.default_filename: str = 'assets'
-        # if a file extension is in this tuple, the parent folder is considered as a valid UE folder
-        self.ue_valid_file_ext = ('.uplugin', '.uproject')  # MUST BE LOWERCASE for comparison
-        # if a folder is in this tuple, the parent folder is considered as a valid ue folder
-        self.ue_valid_asset_subfolder = ('content', 'Content')  # must be a tuple.
-        # if a folder is in this tuple, the parent folder is considered as a valid ue folder for a manifest file
-        self.ue_valid_manifest_subfolder = ('data', 'Data')  # must be a tuple.
-        # subfolder to store an ASSET content for an installation or a download or a scan (same value)
-        self.ue_asset_content_subfolder: str = 'Content'
-        # subfolder to store a PLUGIN for a download in the vaultCache folder
-        self.ue_plugin_vaultcache_subfolder: str = 'data'
-        # subfolder to store a PLUGIN for a download in the vaultCache folder
-        self.ue_plugin_project_subfolder: str = 'Plugins'
-        # subfolder to store a PLUGIN for an installation in an ENGINE folder (relativelly to the base folder of the engine).
-        # USE '/' as separator ! important for path_join
-        self.ue_plugin_install_subfolder: str = 'Engine/Plugins/Marketplace'
-        # file name of a UE manifest file
-        self.ue_manifest_filename: str = 'manifest'
-        # value in orgin column for a marketplace asset
-        self.origin_marketplace = 'Marketplace'
-
-        self.index_copy_col_name: str = 'Index copy'
-        self.group_col_name: str = 'In group'  # could not be 'group' because it's a reserved word in sqlite
-        # if a folder is in this tuple, the folder won't be scanned to find ue folders
-        self.ue_invalid_content_subfolder = (
-            'binaries', 'build', 'deriveddatacache', 'intermediate', 'saved', 'data'
-        )  # must be a tuple. MUST BE LOWERCASE for comparison
-        # if a folder is in this tuple, the folder could be a valid folder but with an incomplete structure
-        self.ue_possible_asset_subfolder = ('blueprints', 'maps', 'textures', 'materials')  # must be a tuple. MUST BE LOWERCASE for comparison
 
         self.app_icon_filename: str = path_join(self.assets_folder, 'main.ico')
         self.default_image_filename: str = path_join(self.assets_folder, 'UEVM_200x200.png')
@@ -98,47 +129,18 @@ class GUISettings:
 
         self.sqlite_filename: str = path_join(self.scraping_folder, self.default_filename + '.db')
 
-        # Notes on testing_switch vamues:
-        # 0: normal mode, no changes in code
-        # 1: testing mode, limit the number of assets to process in several actions
-        # 2: fix the value and limit the number of folders to scan for assets
-        self.testing_assets_limit: int = 300  # when testing (ie testing_switch==1) , limit the number of assets to process to this value
         # self.csv_options = {'on_bad_lines': 'warn', 'encoding': 'utf-8', 'keep_default_na': True, 'na_values': ['None', 'nan', 'NA', 'NaN'], } # fill "empty" cells with the nan value
         self.csv_options = {'on_bad_lines': 'warn', 'encoding': 'utf-8', 'keep_default_na': False}
         # self.scraped_assets_per_page: int = 75  # since 2023-10-31 a value bigger than 75 will COULD be refused by UE API and return a 'common.server_error' error (http 431)
         self.scraped_assets_per_page: int = 100  # using the UC browsezr is slower BUT the number of assets can be bigger
-        self.app_monitor: int = 1
-        self.preview_max_width: int = 150
-        self.preview_max_height: int = 150
-        self.default_global_search: str = 'Text to search...'
-        self.default_value_for_all: str = 'All'
-        self.keyword_query_string = 'QUERY'  # use this keyword in a CALLABLE filter to replace the value by the in the search field
         self.cell_is_nan_list = ['NA', 'None', 'nan', 'NaN', 'NULL', 'null', 'Null']  # keep 'NA' value at first position
         self.cell_is_empty_list = self.cell_is_nan_list + ['False', '0', '0.0', '']
-        self.empty_cell: str = ''
-        self.empty_row_prefix: str = 'new_id_'
-        self.duplicate_row_prefix: str = 'local_id_'
-        self.temp_id_prefix: str = 'temp_id_'
-        self.unknown_size: str = 'yes'
-        self.tag_prefix: str = 't_'
-        self.expand_columns_factor: int = 20
-        self.contract_columns_factor: int = 20
-        self.warning_limit_for_batch_op: int = 20
-        self.engine_version_for_obsolete_assets: str = '4.26'  # fallback value when cli.core.engine_version_for_obsolete_assets is not available without import
         # The list off all the possible value for the field 'category'. It should be updated if necessary
-        self.missing_category = 'Incomplete Asset'
         self.asset_categories = [
             '2D Assets', 'Animations', 'Architectural Visualization', 'Blueprints', 'Characters', 'Code Plugins', 'Environments', 'Epic Content',
             'Materials', 'Megascans', 'Music', 'Props', 'Sound Effects', 'Textures', 'UE Feature Samples', 'UE Game Samples', 'UE Legacy Samples',
             'UE Online Learning', 'Visual Effects', 'Weapons', 'local/Asset', 'local/Manifest', 'local/Plugin', self.missing_category
         ]
-        self.notification_time = 10000  # time in ms to keep notification window on screen
-
-        # ttkbootstrap themes:
-        # light themes : "cosmo", "flatly", "litera", "minty", "lumen", "sandstone", "yeti", "pulse", "united", "morph", "journal", "simplex", "cerculean"
-        # dark themes: "darkly", "superhero", "solar", "cyborg", "vapor"
-        self.theme_name: str = 'lumen'
-        self.theme_font = ('Verdana', 8)
         self.datatable_default_pref = {
             'align': 'w',  #
             'cellbackgr': '#F4F4F3',  #
@@ -97,7 +97,6 @@ class UEVMGui(tk.Tk):
     is_fake = False
     logger = logging.getLogger(__name__.split('.')[-1])  # keep only the class name
     gui_f.update_loggers_level(logger)
-    _errors: [str] = []
     relogin_when_scrapping: bool = False
 
     def __init__(
@@ -113,6 +112,7 @@ class UEVMGui(tk.Tk):
         self._silent_mode: bool = False
         self._choice_result: str = ''
         self._image_url: str = ''
+        self._errors: [str] = []
 
         self.editable_table: Optional[EditableTable] = None
         self.progress_window: Optional[FakeProgressWindow] = None
@@ -750,7 +750,13 @@ class UEVMGui(tk.Tk):
         if row_numbers:
             # convert row numbers to row indexes
             row_indexes = [data_table.get_real_index(row_number) for row_number in row_numbers]
-            selected_rows = data_table.get_data().iloc[row_indexes]  # iloc checked
+            first_index = row_indexes[0]
+            # a -1 index (not found) must be read by the list, a slice starting at -1 would be empty
+            if first_index >= 0 and row_indexes == list(range(first_index, first_index + len(row_indexes))):
+                # a range of rows (ie selected with shift+click) is read with a slice, without copying the rows
+                selected_rows = data_table.get_data().iloc[first_index:first_index + len(row_indexes)]  # iloc checked
+            else:
+                selected_rows = data_table.get_data().iloc[row_indexes]  # iloc checked
         if selected_rows is not None and not selected_rows.empty:
             json_data = {
                 'csv': {
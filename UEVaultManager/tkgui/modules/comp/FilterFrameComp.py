@@ -345,8 +345,15 @@ class FilterFrame(ttk.LabelFrame):
                     method = self.callable.get_method(func_name)
                     if method is None:
                         raise AttributeError(f'Could not find the method {func_name} in the class {self.callable.__class__.__name__}')
-                    # noinspection PyUnusedLocal
                     mask_from_callable = method(*func_params)
+                    if isinstance(mask_from_callable, pd.Series):
+                        # the mask is applied directly, a query would have to parse and evaluate the '@mask_from_callable' expression
+                        if mask_from_callable.all():
+                            # all the rows match, a copy is faster than a selection by mask
+                            # the same object is not returned because the filtered data could be changed in place
+                            return self.df.copy(), error_message
+                        return self.df[mask_from_callable], error_message
+                    # some callables could return a scalar value (ex: False)
                     query = '@mask_from_callable'  # with pandas, we can pass a reference to a mask to execute a query !!!!
                 elif ftype == FilterType.LIST and filter_value:
                     if isinstance(filter_value, str):
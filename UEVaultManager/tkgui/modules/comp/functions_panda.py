@@ -3,10 +3,18 @@
 Utilities functions and tools for pandas
 These functions depend on the globals.py module and can generate circular dependencies when imported.
 """
+from importlib.util import find_spec
+
 import pandas as pd
 
 from UEVaultManager.tkgui.modules import globals as gui_g
-from UEVaultManager.tkgui.modules.functions_no_deps import check_and_convert_list_to_str
+from UEVaultManager.tkgui.modules.functions_no_deps import check_and_convert_list_to_str, convert_to_bool, convert_to_float, convert_to_int
+
+# the pyarrow engine of pandas is only used if pyarrow is installed. It's imported by pandas when used
+pyarrow_available = find_spec('pyarrow') is not None
+
+# values converted to True by convert_to_bool()
+_true_values = ('1', '1.0', 'true', 'yes', 'y', 't')
 
 
 def fillna_fixed(dataframe: pd.DataFrame) -> None:
@@ -19,8 +27,13 @@ def fillna_fixed(dataframe: pd.DataFrame) -> None:
             # dataframe[col].fillna(gui_g.s.empty_cell, inplace=True)  # does not replace all possible values
             dataframe[col].replace(gui_g.s.cell_is_nan_list, gui_g.s.empty_cell, regex=False, inplace=True)
         elif dataframe[col].dtype == 'category':
+            column = dataframe[col]
+            empty_values = gui_g.s.cell_is_nan_list + ['']
+            if not column.isna().any() and not any(str(category) in empty_values for category in column.cat.categories):
+                # nothing to replace, keep the categorical column as it. This function is called on each filtering
+                continue
             # convert to str to do the replacement
-            dataframe[col] = dataframe[col].astype(str)
+            dataframe[col] = column.astype(str)
             dataframe[col].replace(gui_g.s.cell_is_nan_list + [''], gui_g.s.missing_category, regex=False, inplace=True)
             # convert back to category
             dataframe[col] = dataframe[col].astype('category')
@@ -32,6 +45,69 @@ def fillna_fixed(dataframe: pd.DataFrame) -> None:
             dataframe[col].fillna(False, inplace=True)
 
 
+def read_csv(filepath: str, str_columns: list = None, **kwargs) -> pd.DataFrame:
+    """
+    Read a csv file with the pyarrow engine of pandas if pyarrow is installed (much faster on big files), and with the default engine otherwise.
+    :param filepath: path of the csv file.
+    :param str_columns: names of the columns to read as str. Used to avoid the automatic parsing of the dates done by pyarrow.
+    :param kwargs: options passed to pd.read_csv().
+    :return: dataframe.
+
+    Notes:
+        The default engine is also used when the pyarrow engine fails (ex: an option not supported by the pandas version, an empty file).
+    """
+    if pyarrow_available:
+        dtype = {col: str for col in str_columns} if str_columns else None
+        try:
+            return pd.read_csv(filepath, engine='pyarrow', dtype=dtype, **kwargs)
+        except (ValueError, NotImplementedError):
+            # the pyarrow errors (ArrowInvalid, ArrowNotImplementedError) are subclasses of these ones
+            pass
+    return pd.read_csv(filepath, **kwargs)
+
+
+def convert_column(column: pd.Series, converter) -> pd.Series:
+    """
+    Convert the values of a column using a converter returned by get_converters().
+    :param column: column to convert.
+    :param converter: converter to use. A conversion function or a dtype.
+    :return: converted column.
+
+    Notes:
+        When the dtype of the column allows it, a vectorized cast giving the same result as the conversion function is used.
+        Otherwise (ex: object column with mixed values), the conversion function is applied to each value.
+    """
+    if not callable(converter):
+        return column.astype(converter)
+    # kind of the numpy dtypes: 'b' for bool, 'i' and 'u' for int, 'f' for float, 'O' for object
+    # the pandas dtypes (ex: category) are converted value by value
+    kind = '' if isinstance(column.dtype, pd.api.extensions.ExtensionDtype) else column.dtype.kind
+    if converter is str:
+        if kind:
+            return column.astype(str)
+    elif converter is convert_to_int or converter is int:
+        if kind in ('b', 'i', 'u'):
+            return column.astype('int64')
+        if kind == 'f' and converter is convert_to_int:
+            # convert_to_int() returns 0 for a NaN value
+            return column.fillna(0).astype('int64')
+    elif converter is convert_to_float or converter is float:
+        if kind in ('b', 'i', 'u', 'f'):
+            return column.astype('float64')
+    elif converter is convert_to_bool:
+        if kind == 'b':
+            return column
+        if kind in ('i', 'u', 'f'):
+            # only the 1 and 1.0 numbers are converted to True
+            return column == 1
+        if kind == 'O':
+            return column.astype(str).str.lower().isin(_true_values)
+    elif converter is bool:
+        if kind == 'b':
+            return column
+    return column.apply(converter)
+
+
 def post_update_installed_folders(installed_assets_json: dict, df: pd.DataFrame) -> None:
     """
     Update the "installed folders" AFTER loading the data.
@@ -65,7 +65,7 @@ UEVM_cli_ref = None  # avoid importing classes from the UEVM main application he
 #  reference to the log object of the UEVM main application.
 #  If empty, log will be message printed in the console
 UEVM_log_ref = None
-#  reference to the default command line parser (used for help button in gui).
+#  weak reference to the default command line parser (used for help button in gui).
 UEVM_parser_ref = None
 # restult of the last UEVM cli command run from the GUI
 UEVM_command_result = None
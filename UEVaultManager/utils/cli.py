@@ -9,6 +9,22 @@ import re
 from UEVaultManager.models.csv_sql_fields import get_sql_field_name
 from UEVaultManager.tkgui.modules.functions_no_deps import check_and_convert_list_to_str
 
+# boolean value of each string representation of truth, used by str_to_bool(), str_is_bool() and try_str_to_bool()
+_bool_values = {
+    'y': True,
+    'yes': True,
+    't': True,
+    'true': True,
+    'on': True,
+    '1': True,
+    'n': False,
+    'no': False,
+    'f': False,
+    'false': False,
+    'off': False,
+    '0': False,
+}
+
 
 def get_boolean_choice(prompt: str, default=True) -> bool:
     """
@@ -78,13 +94,13 @@ def str_to_bool(val: str) -> bool:
     'val' is anything else.
     :param val: string representation of truth.
     :return: True or False based on the string representation of truth.
+
+    Notes:
+        A bool value (ex: the default value of a missing config option) is returned as it.
     """
-    val_lower = val.lower()
-    if val_lower in ('y', 'yes', 't', 'true', 'on', '1'):
-        return True
-    elif val_lower in ('n', 'no', 'f', 'false', 'off', '0'):
-        return False
-    else:
+    try:
+        return _bool_values[str(val).lower()]
+    except KeyError:
         raise ValueError(f'Invalid value {val}')
 
 
@@ -95,11 +111,20 @@ def str_is_bool(val: str) -> bool:
     :param val: string representation of truth.
     :return: True if the string could be a boolean value, False otherwise.
     """
-    val_lower = val.lower()
-    if val_lower in ('y', 'yes', 't', 'true', 'on', '1', 'n', 'no', 'f', 'false', 'off', '0'):
-        return True
-    else:
-        return False
+    return val.lower() in _bool_values
+
+
+def try_str_to_bool(val: str) -> (bool, any):
+    """
+    Convert a string representation of truth to a boolean value if possible, in a single pass.
+    Boolean values are the same as in str_to_bool().
+    :param val: string representation of truth.
+    :return: (True, boolean value) if the string is a boolean value, (False, val) otherwise.
+    """
+    bool_value = _bool_values.get(val.lower())
+    if bool_value is None:
+        return False, val
+    return True, bool_value
 
 
 def check_and_create_file(full_file_name: str, create_file: bool = True, content=None) -> bool:
@@ -114,15 +139,21 @@ def check_and_create_file(full_file_name: str, create_file: bool = True, content
     file_path, file_name = os.path.split(full_file_name)
 
     # Check if the folder exists, create it if it doesn't
-    if not os.path.isdir(file_path):
+    # Note: file_path is empty if the file is in the current folder
+    if file_path and not os.path.isdir(file_path):
         try:
             os.makedirs(file_path, exist_ok=True)
         except OSError:
             return False
-    if not os.path.isfile(full_file_name) and create_file:
-        with open(full_file_name, 'w', encoding='utf-8') as file:
-            if content:
-                file.write(content)
+    if create_file and not os.path.isfile(full_file_name):
+        # no need to check the access after the creation, opening the file in write mode already proves it's writable
+        try:
+            with open(full_file_name, 'w', encoding='utf-8') as file:
+                if content:
+                    file.write(content)
+        except OSError:
+            return False
+        return True
     return os.access(full_file_name, os.W_OK)
 
 
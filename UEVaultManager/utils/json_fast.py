@@ -0,0 +1,44 @@
+# coding=utf-8
+"""
+Json encoding and decoding functions.
+They use the orjson package when it's installed (much faster on big contents), and the json module otherwise.
+"""
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_loads(data):
+    """
+    Decode a json content.
+    :param data: json content to decode, as bytes or str.
+    :return: decoded data.
+
+    Notes:
+        The errors are raised as json.JSONDecodeError (orjson.JSONDecodeError is a subclass of it).
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(data, indent=False, sort_keys=False) -> str:
+    """
+    Encode data into a json string.
+    :param data: data to encode.
+    :param indent: True to indent the content with 2 spaces.
+    :param sort_keys: True to sort the keys of the dicts.
+    :return: json string.
+
+    Notes:
+        Unlike json.dumps(), non ascii characters are not escaped when orjson is used.
+        The errors are raised as TypeError (orjson.JSONEncodeError is a subclass of it).
+    """
+    if orjson is not None:
+        # OPT_NON_STR_KEYS allows non str keys in dicts, as json.dumps() does
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0) | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        return orjson.dumps(data, option=option).decode('utf-8')
+    return json.dumps(data, indent=2 if indent else None, sort_keys=sort_keys)
@@ -0,0 +1,44 @@
+# coding=utf-8
+"""
+Tests for the functions that read the command line without parsing it.
+"""
+import unittest
+
+from UEVaultManager.cli import get_command_name_from_argv, is_version_asked
+
+
+class TestCliArgv(unittest.TestCase):
+    """
+    Tests for get_command_name_from_argv() and is_version_asked().
+    """
+
+    def test_version_asked(self):
+        self.assertTrue(is_version_asked(['-V']))
+        self.assertTrue(is_version_asked(['--vers']))
+        self.assertTrue(is_version_asked(['-dV']))
+        self.assertFalse(is_version_asked(['list']))
+        self.assertFalse(is_version_asked(['list', '-V']))
+
+    def test_version_in_attached_value(self):
+        self.assertFalse(is_version_asked(['-cV.ini', 'list']))
+        self.assertFalse(is_version_asked(['-cC:\\Users\\Victor\\uevm.ini', 'list']))
+        self.assertFalse(is_version_asked(['-dcV.ini', 'list']))
+        self.assertTrue(is_version_asked(['-Vc', 'uevm.ini', 'list']))
+
+    def test_command_name(self):
+        self.assertEqual(get_command_name_from_argv(['list']), 'list')
+        self.assertEqual(get_command_name_from_argv(['-c', 'uevm.ini', 'list']), 'list')
+        self.assertEqual(get_command_name_from_argv(['-cC:\\Users\\Victor\\uevm.ini', 'list']), 'list')
+        self.assertEqual(get_command_name_from_argv(['-dc', 'uevm.ini', 'list']), 'list')
+        self.assertEqual(get_command_name_from_argv(['-A', '10', 'scrap']), 'scrap')
+        self.assertEqual(get_command_name_from_argv([]), '')
+
+    def test_full_help(self):
+        self.assertEqual(get_command_name_from_argv(['-H', 'list']), '')
+        self.assertEqual(get_command_name_from_argv(['-dH', 'list']), '')
+        self.assertEqual(get_command_name_from_argv(['--full', 'list']), '')
+        self.assertEqual(get_command_name_from_argv(['-cHome.ini', 'scrap']), 'scrap')
+
+
+if __name__ == '__main__':
+    unittest.main()